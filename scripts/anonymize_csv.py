@@ -8,8 +8,15 @@ based on Bitcoin, cryptography, and mathematics pioneers.
 import csv
 import hashlib
 import sys
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
+# Input and output are streamed through 1 MiB buffers
+CSV_BUFFER_SIZE = 1 << 20
+# Rows handed to writer.writerows() at once (keeps memory flat)
+CHUNK_ROWS = 4096
+
 # Adjectives (smart/clever variations)
 ADJECTIVES = [
     "Clever", "Bright", "Brilliant", "Sharp", "Wise", "Savvy", "Astute", "Shrewd",
@@ -27,15 +34,19 @@ FIGURES = [
 ]
 
 
+@lru_cache(maxsize=None)
 def generate_pseudonym(submitter_id: str) -> str:
     """
     Generate a deterministic pseudonym from a submitter_id.
-    Same input always produces the same output.
+    Same input always produces the same output, so results are cached:
+    each distinct submitter is hashed once per run.
     """
     if not submitter_id or submitter_id == "unknown":
         return "Anonymous"
 
-    # Hash the submitter_id to get consistent indices
+    # Hash the submitter_id to get consistent indices.
+    # Must stay SHA-256: worker/src/index.js (generatePseudonym) derives the
+    # same pseudonym for the issue body, so both sides have to agree.
     hash_bytes = hashlib.sha256(submitter_id.encode()).digest()
 
     # Use first bytes for adjective, next bytes for figure
@@ -48,38 +59,45 @@ def generate_pseudonym(submitter_id: str) -> str:
 def anonymize_csv(input_path: Path, output_path: Path):
     """
     Read a CSV, replace submitter_id with pseudonyms, write to output.
+    Rows are streamed from input to output, never held in memory as a whole.
     """
-    with input_path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
-        rows = list(reader)
-
-    if not fieldnames:
-        print(f"Error: No fieldnames in {input_path}")
-        return False
-
-    # Check if submitter_id column exists
-    if "submitter_id" not in fieldnames:
-        print(f"Warning: No submitter_id column in {input_path}, copying as-is")
-        with output_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
-        return True
-
-    # Transform submitter_id to pseudonyms
-    pseudonym_count = 0
-    for row in rows:
-        original_id = row.get("submitter_id", "")
-        if original_id and original_id != "unknown":
-            row["submitter_id"] = generate_pseudonym(original_id)
-            pseudonym_count += 1
-
-    # Write output
-    with output_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    with input_path.open(newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as fi:
+        reader = csv.reader(fi)
+        fieldnames = next(reader, None)
+
+        if not fieldnames:
+            print(f"Error: No fieldnames in {input_path}")
+            return False
+
+        with output_path.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as fo:
+            writer = csv.writer(fo)
+            writer.writerow(fieldnames)
+
+            width = len(fieldnames)
+
+            # Check if submitter_id column exists
+            if "submitter_id" not in fieldnames:
+                print(f"Warning: No submitter_id column in {input_path}, copying as-is")
+                # Pad short rows to the header width
+                writer.writerows(row + [""] * (width - len(row)) for row in reader if row)
+                return True
+
+            # Transform submitter_id to pseudonyms (by column index)
+            sid_idx = fieldnames.index("submitter_id")
+            pseudonym_count = 0
+            while True:
+                chunk = list(islice(reader, CHUNK_ROWS))
+                if not chunk:
+                    break
+                rows = [row for row in chunk if row]  # skip blank lines like DictReader
+                for row in rows:
+                    if len(row) < width:
+                        row += [""] * (width - len(row))
+                    original_id = row[sid_idx]
+                    if original_id and original_id != "unknown":
+                        row[sid_idx] = generate_pseudonym(original_id)
+                        pseudonym_count += 1
+                writer.writerows(rows)
 
     print(f"Anonymized {pseudonym_count} submitter IDs")
     return True
@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 import json
 import re
+import bisect
 import csv
 import datetime
+import operator
 import urllib.request
 import urllib.error
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 LOCATIONS = Path("data/locations.csv")
@@ -12,6 +17,66 @@ CHECKS = Path("data/checks_public.csv")
 APPROVED_ISSUES = Path("data/_approved_issues.json")
 VALIDATION_LOG = Path("data/validation_errors.log")
 
+# locations.csv and checks_public.csv are read and rewritten whole, 1 MiB at a time
+CSV_BUFFER_SIZE = 1 << 20
+URL_CHECK_WORKERS = 8
+# Shared by the validation threads
+URL_OPENER = urllib.request.build_opener()
+
+# checks_public.csv is kept sorted by this key for nicer diffs
+# (C-level itemgetter; both columns are always present in the schema)
+check_sort_key = operator.itemgetter("reviewed_at", "check_id")
+
+# Issue form labels read via body_field() (current and legacy form versions)
+FIELD_LABELS = [
+    "Location-ID (aus locations.csv)",
+    "Location-ID",
+    "Name des Ortes",
+    "Adresse",
+    "Koordinaten (optional, hilft sehr)",
+    "OpenStreetMap-Link (optional)",
+    "OSM-Link (optional, falls vorhanden)",
+    "Website (optional)",
+    "Kategorie",
+    "Wie lief die Zahlung",
+    "Hinweise (kurz)",
+    "Notizen",
+    "Art des Checks",
+    "Check-Typ",
+    'Öffentlicher Beweis-Post (muss "Düsseldorf" (oder "Duesseldorf") und "Bitcoin" enthalten)',
+    "Öffentlicher Beweis-Post",
+    "Beleg (Bon) – Link (Daten schwärzen)",
+    "Beleg (Bon)",
+    'Bitcoin-Zahlungsnachweis – Link (Bestätigung "bezahlt", Betrag/Datum sichtbar; Daten schwärzen)',
+    "Bitcoin-Zahlungsnachweis",
+    "Ort erkennbar – Foto/Video-Link (Schild/Eingang/Kasse)",
+    "Ort erkennbar",
+    "Datum/Uhrzeit des Kaufs",
+    "Datum und Uhrzeit des Kaufs",
+    "Beobachtungen (kurz)",
+    "Was ist passiert",
+    "Beobachtungen",
+]
+
+# Submitter markers written by the web form (new "Ref" and legacy "ID" format)
+SUBMITTER_REF_RE = re.compile(r"\*\*Submitter Ref:\*\*\s*`(USER-[A-F0-9]+)`")
+SUBMITTER_ID_RE = re.compile(r"\*\*Submitter ID:\*\*\s*`(USER-[A-F0-9]+)`")
+OSM_URL_RE = re.compile(r"openstreetmap\.org/(node|way|relation)/(\d+)")
+STREET_HOUSENUMBER_RE = re.compile(r"(.+?)\s+(\d+\S*)$")
+POSTCODE_RE = re.compile(r"(\d{5})\s*")
+
+# Form "Kategorie" keyword -> locations.csv category, in priority order
+CATEGORY_KEYWORDS = (
+    ("restaurant", "restaurant"),
+    ("café", "restaurant"),
+    ("bar", "restaurant"),
+    ("einzelhandel", "shop"),
+    ("shop", "shop"),
+    ("dienstleistung", "service"),
+    ("hotel", "hotel"),
+    ("unterkunft", "hotel"),
+)
+
 
 def log_validation_error(issue_number: int, errors: list[str]):
     """Log validation errors to a persistent file for debugging."""
@@ -38,7 +103,7 @@ def validate_url(url: str, timeout: int = 10) -> tuple[bool, str]:
         req = urllib.request.Request(url, method="HEAD", headers={
             "User-Agent": "sats4berlin-validator/1.0"
         })
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
+        with URL_OPENER.open(req, timeout=timeout) as resp:
             if resp.status < 400:
                 return True, ""
             return False, f"HTTP {resp.status}"
@@ -49,7 +114,7 @@ def validate_url(url: str, timeout: int = 10) -> tuple[bool, str]:
                 req = urllib.request.Request(url, headers={
                     "User-Agent": "sats4berlin-validator/1.0"
                 })
-                with urllib.request.urlopen(req, timeout=timeout) as resp:
+                with URL_OPENER.open(req, timeout=timeout) as resp:
                     return True, ""
             except Exception as e2:
                 return False, str(e2)
@@ -59,9 +124,11 @@ def validate_url(url: str, timeout: int = 10) -> tuple[bool, str]:
     except Exception as e:
         return False, str(e)
 
-def validate_proof_urls(public_post: str, receipt: str, payment: str, venue: str) -> list[str]:
+def validate_proof_urls(public_post: str, receipt: str, payment: str, venue: str,
+                        results: dict) -> list[str]:
     """
     Validate all proof URLs and return list of warnings.
+    results maps each non-empty URL to its validate_url() result.
     """
     warnings = []
     urls = [
@@ -75,7 +142,7 @@ def validate_proof_urls(public_post: str, receipt: str, payment: str, venue: str
         if not url:
             warnings.append(f"{name}: missing")
         else:
-            valid, error = validate_url(url)
+            valid, error = results[url]
             if not valid:
                 warnings.append(f"{name}: {error} ({url[:50]}...)")
 
@@ -85,9 +152,27 @@ def days_ago(days: int) -> str:
     """Return ISO date string for N days ago."""
     return (datetime.date.today() - datetime.timedelta(days=days)).isoformat()
 
-def calculate_activity_factor(submitter_id: str, existing_checks: list) -> tuple[float, int]:
+def index_checks(checks: list) -> tuple[dict[str, list[str]], dict[str, list[dict]]]:
+    """
+    Build both check indexes in one pass:
+    - submitter_id -> sorted reviewed_at dates of their approved checks
+    - location_id -> check rows still awaiting_confirmation
+    """
+    approved_dates = defaultdict(list)
+    awaiting_by_location = defaultdict(list)
+    for chk in checks:
+        if chk.get("review_status") == "approved":
+            approved_dates[chk.get("submitter_id", "")].append(chk.get("reviewed_at", ""))
+        if chk.get("paid_status") == "awaiting_confirmation":
+            awaiting_by_location[chk.get("location_id", "")].append(chk)
+    for dates in approved_dates.values():
+        dates.sort()
+    return approved_dates, awaiting_by_location
+
+def calculate_activity_factor(submitter_id: str, approved_dates: dict, cutoff: str = "") -> tuple[float, int]:
     """
     Calculate activity factor based on submitter's approved checks in last 90 days.
+    approved_dates is the submitter index built by index_checks().
     Returns (factor, check_count).
 
     Per RULES.md:
@@ -96,13 +181,9 @@ def calculate_activity_factor(submitter_id: str, existing_checks: list) -> tuple
     - 5-9 checks: 1.5×
     - ≥10 checks: 2.0×
     """
-    cutoff = days_ago(90)
-    count = 0
-    for chk in existing_checks:
-        if (chk.get("submitter_id", "") == submitter_id and
-            chk.get("review_status") == "approved" and
-            chk.get("reviewed_at", "") >= cutoff):
-            count += 1
+    cutoff = cutoff or days_ago(90)
+    dates = approved_dates.get(submitter_id, ())
+    count = len(dates) - bisect.bisect_left(dates, cutoff)
 
     if count >= 10:
         return 2.0, count
@@ -118,19 +199,44 @@ def add_days(date_iso: str, days: int) -> str:
     return (d + datetime.timedelta(days=days)).isoformat()
 
 def read_csv(path: Path):
-    with path.open(newline="", encoding="utf-8") as f:
+    with path.open(newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
         r = csv.DictReader(f)
         return list(r), r.fieldnames
 
 def write_csv(path: Path, rows, fieldnames):
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for row in rows:
-            w.writerow(row)
+    with path.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+        # Rows are streamed in fieldnames order; missing columns are written empty
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        w.writerows([row.get(k, "") for k in fieldnames] for row in rows)
 
-def body_field(body: str, label: str) -> str:
+def append_csv(path: Path, rows, fieldnames) -> bool:
+    """
+    Append rows to an existing CSV (no header), matching its line terminator.
+    Returns False without writing if the file does not end in a newline;
+    the caller should fall back to write_csv().
     """
+    with path.open("rb") as f:
+        f.seek(0, 2)
+        if f.tell() < 2:
+            return False
+        f.seek(-2, 2)
+        tail = f.read()
+    if tail == b"\r\n":
+        terminator = "\r\n"
+    elif tail.endswith(b"\n"):
+        terminator = "\n"
+    else:
+        return False
+    with path.open("a", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+        w = csv.writer(f, lineterminator=terminator)
+        w.writerows([row.get(k, "") for k in fieldnames] for row in rows)
+    return True
+
+@lru_cache(maxsize=128)
+def compile_field_patterns(label: str) -> tuple:
+    """
+    Compile the body_field() patterns for one label, in priority order.
     GitHub Issue Forms render fields in various formats:
       - ### Label\\n\\nvalue
       - **Label**\\nvalue
@@ -138,64 +244,81 @@ def body_field(body: str, label: str) -> str:
       - Label\\nvalue
     We try multiple patterns to be robust against format changes.
     """
-    if not body:
-        return ""
-
     escaped_label = re.escape(label)
+    return (
+        # Pattern 1: Markdown header format (### Label\n\nvalue)
+        re.compile(rf"###\s*{escaped_label}\s*\n+([^\n#]+)", re.IGNORECASE),
+        # Pattern 2: Bold label with backtick value (**Label:** `value`)
+        re.compile(rf"\*\*{escaped_label}:?\*\*\s*`([^`]+)`", re.IGNORECASE),
+        # Pattern 3: Bold label with plain value (**Label:** value or **Label**\nvalue)
+        re.compile(rf"\*\*{escaped_label}:?\*\*\s*\n*([^\n*]+)", re.IGNORECASE),
+        # Pattern 4: Plain label followed by value (Label\nvalue)
+        re.compile(rf"{escaped_label}\s*\n+([^\n]+)", re.IGNORECASE),
+        # Pattern 5: Label with colon inline (Label: value)
+        re.compile(rf"{escaped_label}:\s*([^\n]+)", re.IGNORECASE),
+    )
+
+# Compiled patterns for every known form label
+FIELD_PATTERNS = {label: compile_field_patterns(label) for label in FIELD_LABELS}
+
+# One pass over the body collects every "### Label\n\nvalue" section
+SECTION_RE = re.compile(r"###\s*([^\n]*?)\s*\n+([^\n#]+)")
+
+def parse_sections(body: str) -> dict:
+    """
+    Map lowercased "### Label" headers to their first value line.
+    Equivalent to pattern 1 of compile_field_patterns() for every label at
+    once, so body_field() only needs the slower patterns for other formats.
+    """
+    sections = {}
+    for m in SECTION_RE.finditer(body or ""):
+        sections.setdefault(m.group(1).lower(), m.group(2).strip())
+    return sections
 
-    # Pattern 1: Markdown header format (### Label\n\nvalue)
-    m = re.search(rf"###\s*{escaped_label}\s*\n+([^\n#]+)", body, re.IGNORECASE)
-    if m and m.group(1).strip():
-        return m.group(1).strip()
-
-    # Pattern 2: Bold label with backtick value (**Label:** `value`)
-    m = re.search(rf"\*\*{escaped_label}:?\*\*\s*`([^`]+)`", body, re.IGNORECASE)
-    if m and m.group(1).strip():
-        return m.group(1).strip()
+@lru_cache(maxsize=4)
+def lowered(body: str) -> str:
+    # body_field() is called ~30 times per issue with the same body
+    return body.lower()
 
-    # Pattern 3: Bold label with plain value (**Label:** value or **Label**\nvalue)
-    m = re.search(rf"\*\*{escaped_label}:?\*\*\s*\n*([^\n*]+)", body, re.IGNORECASE)
-    if m and m.group(1).strip():
-        return m.group(1).strip()
+def body_field(body: str, label: str, sections: dict | None = None) -> str:
+    """
+    Return the first non-empty value for label, see compile_field_patterns().
+    Pass the parse_sections() result to skip re-scanning the body for the
+    common "### Label" format.
+    """
+    if not body:
+        return ""
 
-    # Pattern 4: Plain label followed by value (Label\nvalue)
-    m = re.search(rf"{escaped_label}\s*\n+([^\n]+)", body, re.IGNORECASE)
-    if m and m.group(1).strip():
-        return m.group(1).strip()
+    key = label.lower()
+    patterns = FIELD_PATTERNS.get(label) or compile_field_patterns(label)
+    if sections is not None and key in sections:
+        if sections[key]:
+            return sections[key]
+        patterns = patterns[1:]  # header found but empty: pattern 1 misses
+    elif key not in lowered(body):
+        # Every pattern contains the label itself: a plain substring check
+        # is much cheaper than running the regexes on bodies without it
+        return ""
 
-    # Pattern 5: Label with colon inline (Label: value)
-    m = re.search(rf"{escaped_label}:\s*([^\n]+)", body, re.IGNORECASE)
-    if m and m.group(1).strip():
-        return m.group(1).strip()
+    for pattern in patterns:
+        m = pattern.search(body)
+        if m and m.group(1).strip():
+            return m.group(1).strip()
 
     return ""
 
-def generate_new_location_id(loc_rows: list) -> str:
-    """Generate next available location ID with uniqueness check."""
-    existing_ids = set()
+def max_location_number(loc_rows: list) -> int:
+    """Return the highest numeric suffix of existing DE-BE-* location IDs (0 if none)."""
     max_num = 0
     for r in loc_rows:
         lid = r.get("location_id", "")
         if lid.startswith("DE-BE-"):
-            existing_ids.add(lid)
             try:
                 num = int(lid.replace("DE-BE-", ""))
                 max_num = max(max_num, num)
             except ValueError:
                 print(f"Warning: Invalid location ID format: {lid}")
-
-    # Generate new ID and verify it doesn't exist
-    new_id = f"DE-BE-{max_num + 1:05d}"
-    attempts = 0
-    while new_id in existing_ids and attempts < 1000:
-        max_num += 1
-        new_id = f"DE-BE-{max_num + 1:05d}"
-        attempts += 1
-
-    if attempts >= 1000:
-        raise RuntimeError("Could not generate unique location ID after 1000 attempts")
-
-    return new_id
+    return max_num
 
 
 def main():
@@ -203,13 +326,31 @@ def main():
         print("No approved issues payload found.")
         return
 
-    issues = json.loads(APPROVED_ISSUES.read_text(encoding="utf-8"))
+    # json.loads accepts UTF-8 bytes directly; skips a separate decode pass
+    issues = json.loads(APPROVED_ISSUES.read_bytes())
     if not isinstance(issues, list):
         print("Unexpected issues JSON shape (expected list).")
         return
 
+    # Dates are constant for the whole run
+    today = today_iso()
+    cooldown_until = add_days(today, 90)
+    activity_cutoff = days_ago(90)
+    release_cutoff = days_ago(180)  # Release bounties held for more than 180 days
+
     loc_rows, loc_fields = read_csv(LOCATIONS)
     chk_rows, chk_fields = read_csv(CHECKS)
+    n_loc_fields = len(loc_fields)
+    # Rows before this index are exactly what is on disk; if every new check
+    # sorts after them, checks_public.csv can be appended to instead of rewritten
+    n_chk_on_disk = len(chk_rows)
+    first_insert_pos = n_chk_on_disk
+    # New checks are bisect-inserted, which needs the on-disk order to hold.
+    # The file is also rewritten by other workflows and by hand, so re-sort
+    # it if needed; first_insert_pos = 0 then forces a full rewrite
+    if not all(check_sort_key(a) <= check_sort_key(b) for a, b in zip(chk_rows, chk_rows[1:])):
+        chk_rows.sort(key=check_sort_key)
+        first_insert_pos = 0
 
     # Ensure new_location_status field exists
     if "new_location_status" not in loc_fields:
@@ -227,18 +368,37 @@ def main():
         for r in loc_rows:
             r["location_status"] = r.get("location_status", "active")
 
+    # Count a schema upgrade as an update so the new columns get persisted
+    updated_locations = int(len(loc_fields) != n_loc_fields)
+
     loc_by_id = {r["location_id"]: r for r in loc_rows}
     existing = {r["check_id"] for r in chk_rows if r.get("check_id")}
+    approved_dates, awaiting_by_location = index_checks(chk_rows)
+    location_num = max_location_number(loc_rows)
 
     appended = 0
     new_locations_added = 0
 
+    # Proof URLs of all issues are checked in one shared pool while the loop
+    # keeps going; each distinct URL is requested only once
+    url_pool = ThreadPoolExecutor(max_workers=URL_CHECK_WORKERS)
+    url_checks = {}
+    url_reports = []
+
     for it in issues:
         number = it.get("number")
         if number is None:
             continue
 
+        # Deterministic check id from issue number (no duplicates). Checked
+        # first so re-runs skip applied issues before any parsing, location
+        # creation or URL validation
+        check_id = f"ISSUE-{number}"
+        if check_id in existing:
+            continue
+
         body = it.get("body") or ""
+        sections = parse_sections(body)
 
         # labels from GitHub API are objects with {name: "..."}
         labels = set()
@@ -251,43 +411,36 @@ def main():
 
         # Extract location_id (for existing locations) or generate new one
         location_id = (
-            body_field(body, "Location-ID (aus locations.csv)")
-            or body_field(body, "Location-ID")
+            body_field(body, "Location-ID (aus locations.csv)", sections)
+            or body_field(body, "Location-ID", sections)
         )
 
         if is_new_location and not location_id:
             # New location: generate ID and create entry
-            location_id = generate_new_location_id(loc_rows)
-            name = body_field(body, "Name des Ortes") or ""
-            address = body_field(body, "Adresse") or ""
-            latlon = body_field(body, "Koordinaten (optional, hilft sehr)") or ""
+            # max + 1 is unique by construction, no need to probe existing IDs
+            location_num += 1
+            location_id = f"DE-BE-{location_num:05d}"
+            name = body_field(body, "Name des Ortes", sections) or ""
+            address = body_field(body, "Adresse", sections) or ""
+            latlon = body_field(body, "Koordinaten (optional, hilft sehr)", sections) or ""
             osm_url = (
-                body_field(body, "OpenStreetMap-Link (optional)") or
-                body_field(body, "OSM-Link (optional, falls vorhanden)") or
+                body_field(body, "OpenStreetMap-Link (optional)", sections) or
+                body_field(body, "OSM-Link (optional, falls vorhanden)", sections) or
                 ""
             )
-            website = body_field(body, "Website (optional)") or ""
-            category_raw = body_field(body, "Kategorie") or ""
+            website = body_field(body, "Website (optional)", sections) or ""
+            category_raw = body_field(body, "Kategorie", sections) or ""
             # Parse notes/observations from new location submissions
             notes = (
-                body_field(body, "Wie lief die Zahlung") or
-                body_field(body, "Hinweise (kurz)") or
-                body_field(body, "Notizen") or
+                body_field(body, "Wie lief die Zahlung", sections) or
+                body_field(body, "Hinweise (kurz)", sections) or
+                body_field(body, "Notizen", sections) or
                 ""
             )
 
-            # Map category to simple form
-            category = ""
-            if "restaurant" in category_raw.lower() or "café" in category_raw.lower() or "bar" in category_raw.lower():
-                category = "restaurant"
-            elif "einzelhandel" in category_raw.lower() or "shop" in category_raw.lower():
-                category = "shop"
-            elif "dienstleistung" in category_raw.lower():
-                category = "service"
-            elif "hotel" in category_raw.lower() or "unterkunft" in category_raw.lower():
-                category = "hotel"
-            else:
-                category = "other"
+            # Map category to simple form (first matching keyword wins)
+            category_low = category_raw.lower()
+            category = next((c for kw, c in CATEGORY_KEYWORDS if kw in category_low), "other")
 
             # Parse lat/lon
             lat, lon = "", ""
@@ -299,7 +452,7 @@ def main():
             # Parse OSM type/id from URL
             osm_type, osm_id = "", ""
             if osm_url:
-                m = re.search(r"openstreetmap\.org/(node|way|relation)/(\d+)", osm_url)
+                m = OSM_URL_RE.search(osm_url)
                 if m:
                     osm_type, osm_id = m.group(1), m.group(2)
 
@@ -309,14 +462,14 @@ def main():
             if len(addr_parts) >= 1:
                 street_part = addr_parts[0].strip()
                 # Try to split street and housenumber
-                m = re.match(r"(.+?)\s+(\d+\S*)$", street_part)
+                m = STREET_HOUSENUMBER_RE.match(street_part)
                 if m:
                     street, housenumber = m.group(1), m.group(2)
                 else:
                     street = street_part
             if len(addr_parts) >= 2:
                 plz_city = addr_parts[1].strip()
-                m = re.match(r"(\d{5})\s*", plz_city)
+                m = POSTCODE_RE.match(plz_city)
                 if m:
                     postcode = m.group(1)
 
@@ -335,7 +488,7 @@ def main():
                 "lon": lon,
                 "website": website,
                 "opening_hours": "",
-                "last_verified_at": today_iso(),
+                "last_verified_at": today,
                 "verified_by_count": "1",
                 "verification_confidence": "low",
                 "bounty_base_sats": "21000",
@@ -345,7 +498,7 @@ def main():
                 "location_status": "active",
                 "eligible_now": "yes",
                 "last_check_id": "",
-                "last_updated_at": today_iso(),
+                "last_updated_at": today,
                 "source_last_update": "",
                 "source_last_update_tag": "",
                 "cooldown_until": "",
@@ -355,26 +508,24 @@ def main():
             loc_rows.append(new_loc)
             loc_by_id[location_id] = new_loc
             new_locations_added += 1
+            updated_locations += 1
             print(f"Created new location: {location_id} - {name}")
 
         if not location_id:
             continue
 
-        # Deterministic check id from issue number (no duplicates)
-        check_id = f"ISSUE-{number}"
-        if check_id in existing:
-            continue
+        lr = loc_by_id.get(location_id)
 
         # Get submitter ID - prefer form-generated ID, fall back to GitHub username
         submitter_id = ""
         # Try to extract Submitter Ref from form submission (USER-XXXX format)
         # Note: Issues show pseudonym as "Submitter" but keep the ref for internal tracking
-        submitter_match = re.search(r"\*\*Submitter Ref:\*\*\s*`(USER-[A-F0-9]+)`", body or "")
+        submitter_match = SUBMITTER_REF_RE.search(body)
         if submitter_match:
             submitter_id = submitter_match.group(1)
         else:
             # Fall back to old format (Submitter ID) for backwards compatibility
-            submitter_match = re.search(r"\*\*Submitter ID:\*\*\s*`(USER-[A-F0-9]+)`", body or "")
+            submitter_match = SUBMITTER_ID_RE.search(body)
             if submitter_match:
                 submitter_id = submitter_match.group(1)
             else:
@@ -385,8 +536,8 @@ def main():
 
         # Determine check type (handle both old and new format)
         check_type_raw = (
-            body_field(body, "Art des Checks") or
-            body_field(body, "Check-Typ") or
+            body_field(body, "Art des Checks", sections) or
+            body_field(body, "Check-Typ", sections) or
             ""
         ).strip().lower()
 
@@ -404,7 +555,6 @@ def main():
         if check_type == "critical_change":
             base_bounty = 21000
         else:
-            lr = loc_by_id.get(location_id)
             if lr:
                 try:
                     base_bounty = int(lr.get("bounty_base_sats", "10000") or "10000")
@@ -414,57 +564,55 @@ def main():
                 base_bounty = 10000
 
         # Calculate activity factor based on submitter's recent checks
-        activity_factor, recent_count = calculate_activity_factor(submitter_id, chk_rows)
+        activity_factor, recent_count = calculate_activity_factor(submitter_id, approved_dates, activity_cutoff)
         final_bounty = int(base_bounty * activity_factor)
 
         # Extract URLs
         public_post_url = (
-            body_field(body, 'Öffentlicher Beweis-Post (muss "Düsseldorf" (oder "Duesseldorf") und "Bitcoin" enthalten)')
-            or body_field(body, "Öffentlicher Beweis-Post")
+            body_field(body, 'Öffentlicher Beweis-Post (muss "Düsseldorf" (oder "Duesseldorf") und "Bitcoin" enthalten)', sections)
+            or body_field(body, "Öffentlicher Beweis-Post", sections)
         )
         receipt_proof_url = (
-            body_field(body, "Beleg (Bon) – Link (Daten schwärzen)")
-            or body_field(body, "Beleg (Bon)")
+            body_field(body, "Beleg (Bon) – Link (Daten schwärzen)", sections)
+            or body_field(body, "Beleg (Bon)", sections)
         )
         payment_proof_url = (
-            body_field(body, 'Bitcoin-Zahlungsnachweis – Link (Bestätigung "bezahlt", Betrag/Datum sichtbar; Daten schwärzen)')
-            or body_field(body, "Bitcoin-Zahlungsnachweis")
+            body_field(body, 'Bitcoin-Zahlungsnachweis – Link (Bestätigung "bezahlt", Betrag/Datum sichtbar; Daten schwärzen)', sections)
+            or body_field(body, "Bitcoin-Zahlungsnachweis", sections)
         )
         venue_photo_url = (
-            body_field(body, "Ort erkennbar – Foto/Video-Link (Schild/Eingang/Kasse)")
-            or body_field(body, "Ort erkennbar")
+            body_field(body, "Ort erkennbar – Foto/Video-Link (Schild/Eingang/Kasse)", sections)
+            or body_field(body, "Ort erkennbar", sections)
         )
 
-        submitted_at = body_field(body, "Datum/Uhrzeit des Kaufs") or body_field(body, "Datum und Uhrzeit des Kaufs") or ""
+        submitted_at = body_field(body, "Datum/Uhrzeit des Kaufs", sections) or body_field(body, "Datum und Uhrzeit des Kaufs", sections) or ""
         observations = (
-            body_field(body, "Beobachtungen (kurz)") or
-            body_field(body, "Hinweise (kurz)") or
-            body_field(body, "Wie lief die Zahlung") or  # New location form field
+            body_field(body, "Beobachtungen (kurz)", sections) or
+            body_field(body, "Hinweise (kurz)", sections) or
+            body_field(body, "Wie lief die Zahlung", sections) or  # New location form field
             ""
         )
 
-        # Validate proof URLs
-        url_warnings = validate_proof_urls(public_post_url, receipt_proof_url, payment_proof_url, venue_photo_url)
-        if url_warnings:
-            print(f"  Warning for issue #{number}: URL validation issues:")
-            for w in url_warnings:
-                print(f"    - {w}")
-            # Log to persistent file for debugging
-            log_validation_error(number, url_warnings)
+        # Queue proof URL validation (reported after the loop)
+        proof_urls = (public_post_url, receipt_proof_url, payment_proof_url, venue_photo_url)
+        for url in proof_urls:
+            if url and url not in url_checks:
+                url_checks[url] = url_pool.submit(validate_url, url)
+        url_reports.append((number, proof_urls))
 
-        reviewed_at = today_iso()
+        reviewed_at = today
         reviewer_id = "maintainer"
 
         # Determine initial paid_status
         # For new locations, bounty is held until 3 confirmations
-        lr = loc_by_id.get(location_id)
         if is_new_location or (lr and lr.get("new_location_status") == "pending"):
             paid_status = "awaiting_confirmation"  # Held until location is confirmed
         else:
             paid_status = "pending"  # Ready for payout
 
-        # Append to checks_public.csv
-        chk_rows.append({
+        # Insert into checks_public.csv at its sorted position (history is
+        # already sorted, so no full re-sort is needed before writing)
+        chk = {
             "check_id": check_id,
             "location_id": location_id,
             "submitter_id": submitter_id,
@@ -486,114 +634,140 @@ def main():
             "final_bounty_sats": str(final_bounty),
             "paid_status": paid_status,
             "paid_at": "",
-        })
+        }
+        pos = bisect.bisect_right(chk_rows, check_sort_key(chk), key=check_sort_key)
+        chk_rows.insert(pos, chk)
+        first_insert_pos = min(first_insert_pos, pos)
+        if paid_status == "awaiting_confirmation":
+            awaiting_by_location[location_id].append(chk)
         existing.add(check_id)
+        bisect.insort(approved_dates[submitter_id], reviewed_at)
         appended += 1
 
-        # Update locations.csv row
-        lr = loc_by_id.get(location_id)
+        # Update locations.csv row (one bulk update per location)
         if lr:
-            lr["last_verified_at"] = reviewed_at
-            lr["last_check_id"] = check_id
-            lr["last_updated_at"] = reviewed_at
+            updated_locations += 1
+            lr.update({
+                "last_verified_at": reviewed_at,
+                "last_check_id": check_id,
+                "last_updated_at": reviewed_at,
+            })
 
             # Handle critical changes (location no longer accepts Bitcoin)
             if check_type == "critical_change":
                 # Extract what kind of critical change
                 critical_reason = (
-                    body_field(body, "Was ist passiert") or
-                    body_field(body, "Beobachtungen") or
+                    body_field(body, "Was ist passiert", sections) or
+                    body_field(body, "Beobachtungen", sections) or
                     ""
                 ).lower()
 
                 if "geschlossen" in critical_reason or "closed" in critical_reason:
-                    lr["location_status"] = "closed"
+                    location_status = "closed"
                 elif "umgezogen" in critical_reason or "moved" in critical_reason:
-                    lr["location_status"] = "moved"
+                    location_status = "moved"
                 else:
-                    lr["location_status"] = "deleted"  # No longer accepts Bitcoin
-
-                lr["eligible_now"] = "no"
-                lr["eligible_for_check"] = "no"
-                lr["cooldown_until"] = ""  # No cooldown needed - location is inactive
-                lr["cooldown_days_left"] = ""
-                print(f"Critical change: {location_id} marked as {lr['location_status']}")
+                    location_status = "deleted"  # No longer accepts Bitcoin
+
+                lr.update({
+                    "location_status": location_status,
+                    "eligible_now": "no",
+                    "eligible_for_check": "no",
+                    "cooldown_until": "",  # No cooldown needed - location is inactive
+                    "cooldown_days_left": "",
+                })
+                print(f"Critical change: {location_id} marked as {location_status}")
             else:
                 # Normal check - set cooldown
-                lr["cooldown_until"] = add_days(reviewed_at, 90)
-                lr["eligible_now"] = "no"
-
                 try:
                     new_count = int(lr.get("verified_by_count", "0") or "0") + 1
-                    lr["verified_by_count"] = str(new_count)
                 except (ValueError, TypeError) as e:
                     print(f"Warning: Could not parse verified_by_count for {location_id}: {e}")
                     new_count = 1
-                    lr["verified_by_count"] = "1"
 
                 # Handle new location confirmation tracking
                 if lr.get("new_location_status") == "pending":
                     if new_count >= 3:
                         lr["new_location_status"] = "confirmed"
-                        lr["verification_confidence"] = "high"
+                        verification_confidence = "high"
                         print(f"New location {location_id} confirmed with {new_count} checks!")
                     else:
-                        lr["verification_confidence"] = "low"
+                        verification_confidence = "low"
                         print(f"New location {location_id} has {new_count}/3 confirmations")
                 else:
-                    lr["verification_confidence"] = "medium"
+                    verification_confidence = "medium"
+
+                lr.update({
+                    "cooldown_until": cooldown_until,
+                    "eligible_now": "no",
+                    "verified_by_count": str(new_count),
+                    "verification_confidence": verification_confidence,
+                })
+
+    url_pool.shutdown(wait=True)
+    url_results = {url: fut.result() for url, fut in url_checks.items()}
+    for number, proof_urls in url_reports:
+        url_warnings = validate_proof_urls(*proof_urls, results=url_results)
+        if url_warnings:
+            print(f"  Warning for issue #{number}: URL validation issues:")
+            for w in url_warnings:
+                print(f"    - {w}")
+            # Log to persistent file for debugging
+            log_validation_error(number, url_warnings)
 
     # Release held bounties for:
     # 1. Newly confirmed locations (3+ checks)
     # 2. Locations with 2+ checks (lower threshold to avoid stuck bounties)
     # 3. Bounties held for more than 180 days (timeout)
-    confirmed_locations = {r["location_id"] for r in loc_rows if r.get("new_location_status") == "confirmed"}
+    # (1) and (2) both end up as new_location_status == "confirmed", which is
+    # checked for each location that has held bounties
 
     # Also release for locations with 2+ verified checks (relaxed threshold)
-    partially_confirmed = set()
     for r in loc_rows:
         try:
             count = int(r.get("verified_by_count", "0") or "0")
             if count >= 2 and r.get("new_location_status") == "pending":
-                partially_confirmed.add(r["location_id"])
                 # Upgrade status to confirmed if 2+ checks
                 r["new_location_status"] = "confirmed"
                 r["verification_confidence"] = "medium"
+                updated_locations += 1
                 print(f"Location {r['location_id']} confirmed with {count} checks (relaxed threshold)")
         except ValueError:
             pass
 
     bounties_released = 0
-    cutoff_date = days_ago(180)  # Release bounties held for more than 180 days
-
-    for chk in chk_rows:
-        if chk.get("paid_status") != "awaiting_confirmation":
-            continue
-
-        location_id = chk.get("location_id", "")
-        reviewed_at = chk.get("reviewed_at", "")
 
+    # Only held rows are visited, grouped by location
+    for location_id, held in awaiting_by_location.items():
         # Release if location is confirmed
-        if location_id in confirmed_locations or location_id in partially_confirmed:
-            chk["paid_status"] = "pending"
-            bounties_released += 1
+        lr = loc_by_id.get(location_id)
+        if lr is not None and lr.get("new_location_status") == "confirmed":
+            for chk in held:
+                chk["paid_status"] = "pending"
+            bounties_released += len(held)
             continue
 
         # Release if bounty has been held for more than 180 days
-        if reviewed_at and reviewed_at < cutoff_date:
-            chk["paid_status"] = "pending"
-            bounties_released += 1
-            print(f"Released timed-out bounty for {chk.get('check_id')} (held since {reviewed_at})")
-
-    if appended == 0 and new_locations_added == 0:
+        for chk in held:
+            reviewed_at = chk.get("reviewed_at", "")
+            if reviewed_at and reviewed_at < release_cutoff:
+                chk["paid_status"] = "pending"
+                bounties_released += 1
+                print(f"Released timed-out bounty for {chk.get('check_id')} (held since {reviewed_at})")
+
+    if appended == 0 and bounties_released == 0 and updated_locations == 0:
         print("No new approved issues to apply.")
         return
 
-    # Sort checks for nicer diffs
-    chk_rows.sort(key=lambda r: (r.get("reviewed_at", ""), r.get("check_id", "")))
-
-    write_csv(CHECKS, chk_rows, chk_fields)
-    write_csv(LOCATIONS, loc_rows, loc_fields)
+    # Gate each rewrite independently: serializing an unchanged CSV is wasted work
+    if bounties_released == 0 and first_insert_pos >= n_chk_on_disk:
+        # Existing rows are untouched (no releases, new rows all at the tail)
+        if appended > 0 and not append_csv(CHECKS, chk_rows[n_chk_on_disk:], chk_fields):
+            write_csv(CHECKS, chk_rows, chk_fields)
+    else:
+        write_csv(CHECKS, chk_rows, chk_fields)
+    if updated_locations > 0:
+        write_csv(LOCATIONS, loc_rows, loc_fields)
 
     print(f"Appended {appended} checks, added {new_locations_added} new locations.")
     if bounties_released > 0:
@@ -6,6 +6,7 @@ This replaces the old Berlin BTCMap seed with a simple, manual list based
 on the curated Google Sheet export.
 """
 import csv
+import re
 from pathlib import Path
 import datetime
 
@@ -26,6 +27,14 @@ OUT_FIELDS = [
     "eligible_for_check",
 ]
 
+# Fast path for the common "Street 12, 40210 Düsseldorf[, ...]" shape.
+# Anything else falls through to the split-based parser below.
+ADDRESS_RE = re.compile(
+    r"(?P<street>[^,]+?) +(?P<housenumber>[^\s,]+)\s*,\s*"
+    r"(?P<postcode>\d{5})\s+(?P<city>[^,]*[^\s,])\s*(?:,.*)?",
+    re.DOTALL,
+)
+
 
 def parse_address(addr: str):
     """
@@ -36,6 +45,10 @@ def parse_address(addr: str):
     if not addr:
         return "", "", "", ""
 
+    m = ADDRESS_RE.fullmatch(addr)
+    if m:
+        return (m["street"].strip(), m["housenumber"], m["postcode"], m["city"])
+
     parts = [p.strip() for p in addr.split(",") if p.strip()]
     if len(parts) < 2:
         return "", "", "", ""
@@ -66,75 +79,74 @@ def main():
 
     today = datetime.date.today().isoformat()
 
-    with SHEET.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-
     out_rows = []
     next_id = 1
 
-    for row in rows:
-        name = (row.get("Name Lokal bzw. Geschäft") or "").strip()
-        addr = (row.get("Adresse") or "").strip()
-        status = (row.get("Stand der Dinge (Bitte aktualisieren, wenn sich was geändert hat)") or "").strip()
-
-        # Skip empty / "Nicht bewertet" rows
-        if not name or not addr:
-            continue
-        if status.lower().startswith("nicht bewertet"):
-            continue
-
-        street, housenumber, postcode, city = parse_address(addr)
-
-        location_id = f"DE-DUS-{next_id:05d}"
-        next_id += 1
-
-        # Very simple defaults – these can be refined later
-        verification_confidence = "low"
-        bounty_base = "10000"
-        bounty_critical = "21000"
-        bounty_new = "21000"
-
-        out_row = {
-            "location_id": location_id,
-            "osm_type": "",
-            "osm_id": "",
-            "btcmap_url": "",
-            "name": name,
-            "category": "",
-            "street": street,
-            "housenumber": housenumber,
-            "postcode": postcode,
-            "city": city or "Düsseldorf",
-            "lat": "",
-            "lon": "",
-            "website": "",
-            "opening_hours": "",
-            "last_verified_at": "",
-            "verified_by_count": "0",
-            "verification_confidence": verification_confidence,
-            "bounty_base_sats": bounty_base,
-            "bounty_critical_sats": bounty_critical,
-            "bounty_new_entry_sats": bounty_new,
-            "new_location_status": "pending",
-            "location_status": "active",
-            "eligible_now": "yes",
-            "last_check_id": "",
-            "last_updated_at": today,
-            "source_last_update": "",
-            "source_last_update_tag": "",
-            "cooldown_until": "",
-            "cooldown_days_left": "0",
-            "eligible_for_check": "yes",
-        }
-        out_rows.append(out_row)
+    # The sheet is read row by row
+    with SHEET.open(newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            name = (row.get("Name Lokal bzw. Geschäft") or "").strip()
+            addr = (row.get("Adresse") or "").strip()
+            status = (row.get("Stand der Dinge (Bitte aktualisieren, wenn sich was geändert hat)") or "").strip()
+
+            # Skip empty / "Nicht bewertet" rows
+            if not name or not addr:
+                continue
+            if status.lower().startswith("nicht bewertet"):
+                continue
+
+            street, housenumber, postcode, city = parse_address(addr)
+
+            location_id = f"DE-DUS-{next_id:05d}"
+            next_id += 1
+
+            # Very simple defaults – these can be refined later
+            verification_confidence = "low"
+            bounty_base = "10000"
+            bounty_critical = "21000"
+            bounty_new = "21000"
+
+            out_row = {
+                "location_id": location_id,
+                "osm_type": "",
+                "osm_id": "",
+                "btcmap_url": "",
+                "name": name,
+                "category": "",
+                "street": street,
+                "housenumber": housenumber,
+                "postcode": postcode,
+                "city": city or "Düsseldorf",
+                "lat": "",
+                "lon": "",
+                "website": "",
+                "opening_hours": "",
+                "last_verified_at": "",
+                "verified_by_count": "0",
+                "verification_confidence": verification_confidence,
+                "bounty_base_sats": bounty_base,
+                "bounty_critical_sats": bounty_critical,
+                "bounty_new_entry_sats": bounty_new,
+                "new_location_status": "pending",
+                "location_status": "active",
+                "eligible_now": "yes",
+                "last_check_id": "",
+                "last_updated_at": today,
+                "source_last_update": "",
+                "source_last_update_tag": "",
+                "cooldown_until": "",
+                "cooldown_days_left": "0",
+                "eligible_for_check": "yes",
+            }
+            out_rows.append(out_row)
 
     OUT.parent.mkdir(parents=True, exist_ok=True)
     with OUT.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=OUT_FIELDS)
-        writer.writeheader()
-        for r in out_rows:
-            writer.writerow(r)
+        writer = csv.writer(f)
+        writer.writerow(OUT_FIELDS)
+        # Plain csv.writer with the dicts read in OUT_FIELDS order
+        writer.writerows([rec[k] for k in OUT_FIELDS] for rec in out_rows)
 
     print(f"Wrote {OUT} with {len(out_rows)} Düsseldorf locations.")
 
@@ -3,22 +3,36 @@
 Calculate the exact payout amount for a sats4berlin check.
 
 Usage:
-    python scripts/calculate_payout.py <issue_number>
+    python scripts/calculate_payout.py <issue_number> [<issue_number> ...]
     python scripts/calculate_payout.py 42
+    python scripts/calculate_payout.py 42 43 44
 
 Requirements:
-    - GitHub CLI (gh) installed and authenticated
+    - GitHub CLI (gh) installed and authenticated, or GH_TOKEN/GITHUB_TOKEN
+      and GITHUB_REPOSITORY set (issues are then fetched via the REST API)
     - Run from the repository root
 """
 
 import subprocess
 import json
 import csv
+import os
 import re
 import sys
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
+LOCATION_ID_RE = re.compile(r"\*\*Location-ID:\*\*\s*`([^`]+)`")
+LOCATION_ID_FORM_RE = re.compile(r"### Location-ID\s+([A-Z]{2}-[A-Z]{2}-\d+)")
+SUBMITTER_REF_RE = re.compile(r"\*\*Submitter Ref:\*\*\s*`(USER-[A-F0-9]+)`")
+SUBMITTER_ID_RE = re.compile(r"\*\*Submitter ID:\*\*\s*`(USER-[A-F0-9]+)`")
+PSEUDONYM_RE = re.compile(r"\*\*Submitter:\*\*\s*([^\n]+)")
+
 
 def get_issue(issue_number: int) -> dict:
     """Fetch issue details from GitHub."""
@@ -31,15 +45,55 @@ def get_issue(issue_number: int) -> dict:
     return json.loads(result.stdout)
 
 
+def get_issue_rest(issue_number: int, repo: str, token: str) -> dict:
+    """Fetch issue details from the GitHub REST API (no gh process spawn)."""
+    req = urllib.request.Request(
+        f"https://api.github.com/repos/{repo}/issues/{issue_number}",
+        headers={
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {token}",
+            "User-Agent": "sats4duesseldorf-payout",
+        },
+    )
+    with urllib.request.urlopen(req, timeout=30) as resp:
+        data = json.loads(resp.read())
+    return {"body": data.get("body") or "", "title": data.get("title", ""), "labels": data.get("labels", [])}
+
+
+def get_issues(issue_numbers: list[int]) -> dict:
+    """
+    Fetch several issues concurrently.
+    Returns issue_number -> issue dict, or the exception raised while fetching it.
+    """
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    repo = os.environ.get("GITHUB_REPOSITORY")
+
+    def fetch_safe(n):
+        if token and repo:
+            try:
+                return get_issue_rest(n, repo, token)
+            except (OSError, ValueError):
+                # URLError, timeouts, bad JSON: fall back to the gh CLI below
+                pass
+        try:
+            return get_issue(n)
+        # OSError also covers a missing gh binary
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=min(8, len(issue_numbers)) or 1) as pool:
+        return dict(zip(issue_numbers, pool.map(fetch_safe, issue_numbers)))
+
+
 def extract_location_id(body: str) -> str | None:
     """Extract Location-ID from issue body."""
     # Try form format first: **Location-ID:** `DE-BE-00042`
-    match = re.search(r"\*\*Location-ID:\*\*\s*`([^`]+)`", body)
+    match = LOCATION_ID_RE.search(body)
     if match:
         return match.group(1)
 
     # Try GitHub issue form format
-    match = re.search(r"### Location-ID\s+([A-Z]{2}-[A-Z]{2}-\d+)", body)
+    match = LOCATION_ID_FORM_RE.search(body)
     if match:
         return match.group(1)
 
@@ -49,11 +103,11 @@ def extract_location_id(body: str) -> str | None:
 def extract_submitter_id(body: str) -> str | None:
     """Extract Submitter ID from issue body."""
     # Try new format "Submitter Ref" first (issues now show pseudonym as "Submitter")
-    match = re.search(r"\*\*Submitter Ref:\*\*\s*`(USER-[A-F0-9]+)`", body)
+    match = SUBMITTER_REF_RE.search(body)
     if match:
         return match.group(1)
     # Fall back to old format for backwards compatibility
-    match = re.search(r"\*\*Submitter ID:\*\*\s*`(USER-[A-F0-9]+)`", body)
+    match = SUBMITTER_ID_RE.search(body)
     if match:
         return match.group(1)
     return None
@@ -61,7 +115,7 @@ def extract_submitter_id(body: str) -> str | None:
 
 def extract_pseudonym(body: str) -> str | None:
     """Extract submitter pseudonym from issue body."""
-    match = re.search(r"\*\*Submitter:\*\*\s*([^\n]+)", body)
+    match = PSEUDONYM_RE.search(body)
     if match:
         return match.group(1).strip()
     return None
@@ -79,6 +133,29 @@ def is_new_location(labels: list) -> bool:
     return any(label.get("name") == "new-location" for label in labels)
 
 
+@lru_cache(maxsize=None)
+def load_location_bounties(csv_path: Path) -> dict[str, tuple[str, str]]:
+    """Read locations.csv once: location_id -> (bounty_base_sats, last_verified_at)."""
+    bounties = {}
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            # Keep the first row for duplicate location_ids
+            bounties.setdefault(row.get("location_id"), (row.get("bounty_base_sats", ""), row.get("last_verified_at", "")))
+    return bounties
+
+
+@lru_cache(maxsize=None)
+def load_check_dates(csv_path: Path) -> dict[str, list[str]]:
+    """Read checks_public.csv once: submitter_id -> list of check dates."""
+    dates = defaultdict(list)
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            check_date_str = row.get("check_date", "")
+            if check_date_str:
+                dates[row.get("submitter_id")].append(check_date_str)
+    return dates
+
+
 def get_base_bounty(location_id: str, check_type: str) -> tuple[int, str]:
     """Look up base bounty from locations.csv."""
     csv_path = Path("data/locations.csv")
@@ -86,18 +163,16 @@ def get_base_bounty(location_id: str, check_type: str) -> tuple[int, str]:
     if not csv_path.exists():
         return 0, "locations.csv not found"
 
-    with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get("location_id") == location_id:
-                if check_type == "critical":
-                    return 21000, "Critical change (fixed)"
+    entry = load_location_bounties(csv_path).get(location_id)
+    if entry is None:
+        return 0, f"Location {location_id} not found in CSV"
 
-                bounty = int(row.get("bounty_base_sats", 0) or 0)
-                last_check = row.get("last_verified_at", "")
-                return bounty, f"Based on last check: {last_check or 'never'}"
+    if check_type == "critical":
+        return 21000, "Critical change (fixed)"
 
-    return 0, f"Location {location_id} not found in CSV"
+    bounty_str, last_check = entry
+    bounty = int(bounty_str or 0)
+    return bounty, f"Based on last check: {last_check or 'never'}"
 
 
 def count_recent_checks(submitter_id: str, days: int = 90) -> int:
@@ -113,18 +188,13 @@ def count_recent_checks(submitter_id: str, days: int = 90) -> int:
     cutoff = datetime.now() - timedelta(days=days)
     count = 0
 
-    with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get("submitter_id") == submitter_id:
-                check_date_str = row.get("check_date", "")
-                if check_date_str:
-                    try:
-                        check_date = datetime.fromisoformat(check_date_str.replace("Z", "+00:00"))
-                        if check_date.replace(tzinfo=None) >= cutoff:
-                            count += 1
-                    except ValueError:
-                        pass
+    for check_date_str in load_check_dates(csv_path).get(submitter_id, ()):
+        try:
+            check_date = datetime.fromisoformat(check_date_str.replace("Z", "+00:00"))
+            if check_date.replace(tzinfo=None) >= cutoff:
+                count += 1
+        except ValueError:
+            pass
 
     return count
 
@@ -141,29 +211,18 @@ def get_activity_multiplier(check_count: int) -> tuple[float, str]:
         return 1.0, f"1.0x ({check_count} checks in 90 days, 0-1)"
 
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python scripts/calculate_payout.py <issue_number>")
-        print("Example: python scripts/calculate_payout.py 42")
-        sys.exit(1)
+def describe_fetch_error(e: Exception) -> str:
+    if isinstance(e, subprocess.CalledProcessError):
+        return e.stderr
+    if isinstance(e, urllib.error.HTTPError):
+        return f"HTTP {e.code}"
+    if isinstance(e, urllib.error.URLError):
+        return str(e.reason)
+    return str(e)
 
-    try:
-        issue_number = int(sys.argv[1])
-    except ValueError:
-        print(f"Error: '{sys.argv[1]}' is not a valid issue number")
-        sys.exit(1)
-
-    print(f"\n{'='*50}")
-    print(f"  PAYOUT CALCULATION FOR ISSUE #{issue_number}")
-    print(f"{'='*50}\n")
-
-    # Fetch issue
-    try:
-        issue = get_issue(issue_number)
-    except subprocess.CalledProcessError as e:
-        print(f"Error fetching issue: {e.stderr}")
-        sys.exit(1)
 
+def print_payout(issue: dict):
+    """Print the payout calculation for one fetched issue."""
     body = issue.get("body", "")
     labels = issue.get("labels", [])
 
@@ -220,5 +279,40 @@ def main():
     print()
 
 
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python scripts/calculate_payout.py <issue_number> [<issue_number> ...]")
+        print("Example: python scripts/calculate_payout.py 42")
+        sys.exit(1)
+
+    issue_numbers = []
+    for arg in sys.argv[1:]:
+        try:
+            issue_numbers.append(int(arg))
+        except ValueError:
+            print(f"Error: '{arg}' is not a valid issue number")
+            sys.exit(1)
+
+    # Fetch all issues up front, concurrently
+    issues = get_issues(issue_numbers)
+
+    failed = False
+    for issue_number in issue_numbers:
+        print(f"\n{'='*50}")
+        print(f"  PAYOUT CALCULATION FOR ISSUE #{issue_number}")
+        print(f"{'='*50}\n")
+
+        issue = issues[issue_number]
+        if isinstance(issue, Exception):
+            print(f"Error fetching issue: {describe_fetch_error(issue)}")
+            failed = True
+            continue
+
+        print_payout(issue)
+
+    if failed:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -10,12 +10,20 @@ This ensures that both BTCMap verifications AND local checks trigger cooldowns.
 """
 import csv
 import datetime as dt
+import os
+import re
 from pathlib import Path
 
 LOC_PATH = Path("data/locations.csv")
 RAW_PATH = Path("data/berlin_raw.csv")
 
 COOLDOWN_DAYS = 90
+COOLDOWN_DELTA = dt.timedelta(days=COOLDOWN_DAYS)
+
+# Buffer size for the locations/raw CSV streams (1 MiB)
+CSV_BUFFER_SIZE = 1 << 20
+
+ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
 
 
 def parse_date(value: str):
@@ -24,17 +32,21 @@ def parse_date(value: str):
     s = str(value).strip()
     if not s:
         return None
-    # accept YYYY-MM-DD
+    # accept YYYY-MM-DD; the common shape is built directly, without
+    # fromisoformat and its exception path
+    if ISO_DATE_RE.match(s):
+        try:
+            return dt.date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+        except ValueError:
+            return None
+    if not s[0].isdigit():
+        return None
     try:
         return dt.date.fromisoformat(s[:10])
     except (ValueError, TypeError):
         return None
 
 
-def add_days(d: dt.date, days: int) -> dt.date:
-    return d + dt.timedelta(days=days)
-
-
 def max_date(*ds):
     out = None
     for d in ds:
@@ -43,38 +55,8 @@ def max_date(*ds):
     return out
 
 
-def main():
-    if not LOC_PATH.exists():
-        raise SystemExit("Missing data/locations.csv")
-    if not RAW_PATH.exists():
-        raise SystemExit("Missing data/berlin_raw.csv")
-
-    # Load locations
-    with LOC_PATH.open(newline="", encoding="utf-8") as f:
-        r = csv.DictReader(f)
-        loc_fields = r.fieldnames or []
-        loc_rows = list(r)
-
-    required_cols = [
-        "source_last_update", "source_last_update_tag",
-        "cooldown_until", "cooldown_days_left",
-        "eligible_now", "eligible_for_check",
-    ]
-    for c in required_cols:
-        if c not in loc_fields:
-            raise SystemExit(f"Missing column in locations.csv: {c}")
-
-    # Load raw (BTCMap/OSM extract)
-    with RAW_PATH.open(newline="", encoding="utf-8") as f:
-        rr = csv.DictReader(f)
-        raw_fields = rr.fieldnames or []
-        raw_rows = list(rr)
-
-    for c in ["osm_type", "osm_id", "check_date", "survey:date"]:
-        if c not in raw_fields:
-            raise SystemExit(f"Missing column in berlin_raw.csv: {c}")
-
-    # Index raw by (osm_type, osm_id) -> (best_date, tag_used)
+def build_raw_index(raw_rows) -> dict:
+    """Map (osm_type, osm_id) -> (best_date, tag_used, best_date_iso) over raw rows."""
     raw_index = {}
     for row in raw_rows:
         osm_type = (row.get("osm_type") or "").strip()
@@ -82,8 +64,14 @@ def main():
         if not osm_type or not osm_id:
             continue
 
-        d_check = parse_date(row.get("check_date", ""))
-        d_survey = parse_date(row.get("survey:date", ""))
+        check_date = row.get("check_date")
+        survey_date = row.get("survey:date")
+        # many elements carry neither date: skip them before parsing
+        if not check_date and not survey_date:
+            continue
+
+        d_check = parse_date(check_date)
+        d_survey = parse_date(survey_date)
 
         # pick best date; prefer check_date if it's the newest (or only)
         d_best = max_date(d_check, d_survey)
@@ -94,96 +82,141 @@ def main():
         k = (osm_type, osm_id)
         cur = raw_index.get(k)
         if cur is None or d_best > cur[0]:
-            raw_index[k] = (d_best, tag)
+            raw_index[k] = (d_best, tag, d_best.isoformat())
+
+    return raw_index
+
+
+# Status values that indicate inactive locations (should not be eligible)
+INACTIVE_STATUSES = {"deleted", "closed", "moved"}
+
+
+def update_cooldown(row: dict, raw_index: dict, today: dt.date, cooldown_by_date: dict) -> tuple[str, bool]:
+    """
+    Update one location row in place.
+    Returns (outcome, used_local_check) with outcome "inactive", "missing" or "updated".
+    """
+    # Skip inactive locations - they should remain ineligible
+    location_status = (row.get("location_status") or "").strip().lower()
+    if location_status in INACTIVE_STATUSES:
+        # Ensure these locations stay ineligible
+        row["eligible_now"] = "no"
+        row["eligible_for_check"] = "no"
+        row["cooldown_until"] = ""
+        row["cooldown_days_left"] = ""
+        return "inactive", False
+
+    # Get BTCMap/OSM date. raw_index never holds empty keys, so manual
+    # (non-OSM) locations skip building the key and the lookup entirely
+    osm_id = row.get("osm_id")
+    if osm_id and raw_index:
+        btcmap_result = raw_index.get(((row.get("osm_type") or "").strip(), osm_id.strip()))
+    else:
+        btcmap_result = None
+    d_btcmap = btcmap_result[0] if btcmap_result else None
+
+    # Get local verification date (from sats4berlin checks)
+    d_local = parse_date(row.get("last_verified_at", ""))
+
+    # Use the MAXIMUM of both dates for cooldown calculation
+    # This ensures both BTCMap and local checks trigger cooldowns
+    d_effective = max_date(d_btcmap, d_local)
+
+    if not d_effective:
+        # No dates at all -> allow check
+        row["source_last_update"] = ""
+        row["source_last_update_tag"] = ""
+        row["cooldown_until"] = ""
+        row["cooldown_days_left"] = "0"
+        row["eligible_now"] = "yes"
+        row["eligible_for_check"] = "yes"
+        return "missing", False
+
+    # Determine which source provided the effective date
+    used_local_check = bool(d_local and d_local == d_effective)
+
+    # Many locations share an effective date: cache the derived values
+    # (cooldown_until, cooldown_days_left, eligible) per date
+    cooldown = cooldown_by_date.get(d_effective)
+    if cooldown is None:
+        cooldown_until = d_effective + COOLDOWN_DELTA
+        days_left = (cooldown_until - today).days
+        if days_left < 0:
+            days_left = 0
+        eligible = "yes" if days_left == 0 else "no"
+        cooldown = cooldown_by_date[d_effective] = (cooldown_until.isoformat(), str(days_left), eligible)
+    cooldown_until_iso, days_left_str, eligible = cooldown
 
-    today = dt.date.today()
+    # Update source_last_update to BTCMap date (for display/tracking)
+    # But use effective date for cooldown calculation
+    if d_btcmap:
+        row["source_last_update"] = btcmap_result[2]
+        row["source_last_update_tag"] = btcmap_result[1]
+    else:
+        row["source_last_update"] = ""
+        row["source_last_update_tag"] = ""
 
-    updated = 0
-    missing_upstream = 0
-    used_local_check = 0
-    skipped_inactive = 0
-
-    # Status values that indicate inactive locations (should not be eligible)
-    INACTIVE_STATUSES = {"deleted", "closed", "moved"}
-
-    for row in loc_rows:
-        # Skip inactive locations - they should remain ineligible
-        location_status = (row.get("location_status") or "").strip().lower()
-        if location_status in INACTIVE_STATUSES:
-            # Ensure these locations stay ineligible
-            row["eligible_now"] = "no"
-            row["eligible_for_check"] = "no"
-            row["cooldown_until"] = ""
-            row["cooldown_days_left"] = ""
-            skipped_inactive += 1
-            continue
+    row["cooldown_until"] = cooldown_until_iso
+    row["cooldown_days_left"] = days_left_str
+    row["eligible_now"] = eligible
+    row["eligible_for_check"] = eligible
+    return "updated", used_local_check
 
-        osm_type = (row.get("osm_type") or "").strip()
-        osm_id = (row.get("osm_id") or "").strip()
-        k = (osm_type, osm_id)
 
-        # Get BTCMap/OSM date
-        btcmap_result = raw_index.get(k)
-        d_btcmap = btcmap_result[0] if btcmap_result else None
-        btcmap_tag = btcmap_result[1] if btcmap_result else ""
-
-        # Get local verification date (from sats4berlin checks)
-        d_local = parse_date(row.get("last_verified_at", ""))
-
-        # Use the MAXIMUM of both dates for cooldown calculation
-        # This ensures both BTCMap and local checks trigger cooldowns
-        d_effective = max_date(d_btcmap, d_local)
-
-        # Determine which source provided the effective date
-        if d_effective:
-            if d_local and d_local == d_effective:
-                source_tag = "local_check"
-                used_local_check += 1
-            else:
-                source_tag = btcmap_tag
-        else:
-            source_tag = ""
-
-        if not d_effective:
-            # No dates at all -> allow check
-            row["source_last_update"] = ""
-            row["source_last_update_tag"] = ""
-            row["cooldown_until"] = ""
-            row["cooldown_days_left"] = "0"
-            row["eligible_now"] = "yes"
-            row["eligible_for_check"] = "yes"
-            missing_upstream += 1
-            continue
+def main():
+    if not LOC_PATH.exists():
+        raise SystemExit("Missing data/locations.csv")
+    if not RAW_PATH.exists():
+        raise SystemExit("Missing data/berlin_raw.csv")
 
-        cooldown_until = add_days(d_effective, COOLDOWN_DAYS)
-        days_left = (cooldown_until - today).days
-        if days_left < 0:
-            days_left = 0
-        eligible = "yes" if days_left == 0 else "no"
+    today = dt.date.today()
+    counts = {"updated": 0, "missing": 0, "inactive": 0, "local_check": 0}
+    cooldown_by_date = {}
+    tmp_path = LOC_PATH.with_suffix(".csv.tmp")
+
+    # Stream locations.csv through to a temp file and swap it in at the end
+    with LOC_PATH.open(newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+        r = csv.DictReader(f)
+        loc_fields = r.fieldnames or []
 
-        # Update source_last_update to BTCMap date (for display/tracking)
-        # But use effective date for cooldown calculation
-        if d_btcmap:
-            row["source_last_update"] = d_btcmap.isoformat()
-            row["source_last_update_tag"] = btcmap_tag
-        else:
-            row["source_last_update"] = ""
-            row["source_last_update_tag"] = ""
-
-        row["cooldown_until"] = cooldown_until.isoformat()
-        row["cooldown_days_left"] = str(days_left)
-        row["eligible_now"] = eligible
-        row["eligible_for_check"] = eligible
-        updated += 1
-
-    # Write back
-    with LOC_PATH.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=loc_fields)
-        w.writeheader()
-        for row in loc_rows:
-            w.writerow(row)
-
-    print(f"OK: updated={updated}, missing_dates={missing_upstream}, used_local_check={used_local_check}, skipped_inactive={skipped_inactive}")
+        required_cols = [
+            "source_last_update", "source_last_update_tag",
+            "cooldown_until", "cooldown_days_left",
+            "eligible_now", "eligible_for_check",
+        ]
+        for c in required_cols:
+            if c not in loc_fields:
+                raise SystemExit(f"Missing column in locations.csv: {c}")
+
+        # Index raw (BTCMap/OSM extract) by (osm_type, osm_id) -> (best_date, tag_used, iso),
+        # keeping the max per key while streaming the file
+        with RAW_PATH.open(newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as rf:
+            rr = csv.DictReader(rf)
+            raw_fields = rr.fieldnames or []
+            for c in ["osm_type", "osm_id", "check_date", "survey:date"]:
+                if c not in raw_fields:
+                    raise SystemExit(f"Missing column in berlin_raw.csv: {c}")
+            raw_index = build_raw_index(rr)
+
+        def updated_rows():
+            for row in r:
+                outcome, used_local = update_cooldown(row, raw_index, today, cooldown_by_date)
+                counts[outcome] += 1
+                counts["local_check"] += used_local
+                yield row
+
+        try:
+            with tmp_path.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as out:
+                w = csv.DictWriter(out, fieldnames=loc_fields)
+                w.writeheader()
+                w.writerows(updated_rows())
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    os.replace(tmp_path, LOC_PATH)
+
+    print(f"OK: updated={counts['updated']}, missing_dates={counts['missing']}, used_local_check={counts['local_check']}, skipped_inactive={counts['inactive']}")
 
 
 if __name__ == "__main__":
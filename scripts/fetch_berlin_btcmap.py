@@ -5,6 +5,7 @@ Fetch Bitcoin-accepting locations in Düsseldorf from OpenStreetMap via Overpass
 Queries OSM directly for the most up-to-date check_date and survey:date values.
 """
 import csv
+import gzip
 import json
 import time
 import urllib.request
@@ -66,14 +67,22 @@ def fetch_from_overpass() -> list[dict]:
     req = urllib.request.Request(
         OVERPASS_URL,
         data=data,
-        headers={"User-Agent": "sats4duesseldorf/1.0 (https://github.com/arbadacarbaYK/sats4duesseldorf)"},
+        headers={
+            "User-Agent": "sats4duesseldorf/1.0 (https://github.com/arbadacarbaYK/sats4duesseldorf)",
+            # The JSON is very repetitive; urllib does not decompress on its own
+            "Accept-Encoding": "gzip",
+        },
     )
 
     max_retries = 3
     for attempt in range(max_retries):
         try:
             with urllib.request.urlopen(req, timeout=120) as resp:
-                result = json.loads(resp.read().decode("utf-8"))
+                body = resp.read()
+                if resp.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+            # json.loads takes the UTF-8 bytes directly (no decoded copy)
+            result = json.loads(body)
 
             elements = result.get("elements", [])
             print(f"Fetched {len(elements)} Bitcoin-accepting elements from OSM.")
@@ -97,6 +106,24 @@ def fetch_from_overpass() -> list[dict]:
     return []  # Should not reach here
 
 
+# Payment tag values, checked by yn()
+YES_VALUES = frozenset(("yes", "Yes", "true", "True", True))
+NO_VALUES = frozenset(("no", "No", "false", "False", False))
+
+
+def yn(val) -> str:
+    """Map a payment tag value to "True"/"False"/""."""
+    if val in YES_VALUES:
+        return "True"
+    if val in NO_VALUES:
+        return "False"
+    return ""
+
+
+# OSM tag keys that determine a location's category, in priority order
+CATEGORY_KEYS = ("amenity", "shop", "office", "tourism", "leisure", "craft")
+
+
 def extract_row(element: dict) -> dict:
     """Extract CSV row from OSM element."""
     tags = element.get("tags", {})
@@ -122,20 +149,12 @@ def extract_row(element: dict) -> dict:
     # Determine category from OSM tags
     category_key = ""
     category = "other"
-    for key in ["amenity", "shop", "office", "tourism", "leisure", "craft"]:
+    for key in CATEGORY_KEYS:
         if key in tags:
             category_key = key
             category = tags[key]
             break
 
-    # Payment methods
-    def yn(val):
-        if val in ("yes", "Yes", "true", "True", True):
-            return "True"
-        if val in ("no", "No", "false", "False", False):
-            return "False"
-        return ""
-
     # Get the most recent check_date (prefer check_date:currency:XBT, then check_date)
     check_date = tags.get("check_date:currency:XBT", "") or tags.get("check_date", "")
 
@@ -179,9 +198,10 @@ def main():
     # Write CSV
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     with OUTPUT_PATH.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-        writer.writeheader()
-        writer.writerows(rows)
+        # Plain csv.writer with the dicts read in FIELDNAMES order
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        writer.writerows([r[k] for k in FIELDNAMES] for r in rows)
 
     print(f"Wrote {len(rows)} rows to {OUTPUT_PATH}")
 
@@ -5,6 +5,8 @@ Generate BTCMap verification link and copy-paste notes for a location.
 Usage:
     python scripts/generate_btcmap_link.py <location_id> [--issue <issue_number>]
     python scripts/generate_btcmap_link.py DE-BE-00042 --issue 15
+    python scripts/generate_btcmap_link.py DE-BE-00042 DE-BE-00043 --issue 15 --issue 16
+    python scripts/generate_btcmap_link.py --all --json
 
 This script:
 1. Looks up the OSM type and ID from locations.csv
@@ -13,37 +15,117 @@ This script:
 """
 
 import csv
+import os
 import sys
 import argparse
 import subprocess
 import json
 import re
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
+LOCATIONS_CSV = Path("data/locations.csv")
+
+# Proof field -> (bold "**N. Label**" pattern, plain "Label\n value" fallback)
+PROOF_PATTERNS = {
+    "public_post": (
+        re.compile(r"\*\*1\. Öffentlicher Post[^*]*\*\*\s*`?([^\n`]+)", re.IGNORECASE),
+        re.compile(r"Öffentlicher Post[^\n]*\n+([^\n]+)", re.IGNORECASE),
+    ),
+    "receipt": (
+        re.compile(r"\*\*2\. Kaufbeleg[^*]*\*\*\s*`?([^\n`]+)", re.IGNORECASE),
+        re.compile(r"Kaufbeleg[^\n]*\n+([^\n]+)", re.IGNORECASE),
+    ),
+    "payment": (
+        re.compile(r"\*\*3\. Bitcoin-Zahlung[^*]*\*\*\s*`?([^\n`]+)", re.IGNORECASE),
+        re.compile(r"Bitcoin-Zahlung[^\n]*\n+([^\n]+)", re.IGNORECASE),
+    ),
+    "venue": (
+        re.compile(r"\*\*4\. Foto vom Ort[^*]*\*\*\s*`?([^\n`]+)", re.IGNORECASE),
+        re.compile(r"Foto vom Ort[^\n]*\n+([^\n]+)", re.IGNORECASE),
+    ),
+}
+
+
+@lru_cache(maxsize=4)
+def load_location_index(csv_path: Path, mtime: float) -> dict[str, tuple[str, str, str]]:
+    """Read locations.csv once: location_id -> (name, osm_type, osm_id).
+
+    mtime is part of the cache key so a rewritten file is re-read.
+    """
+    index = {}
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if "location_id" not in header:
+            return index
+        cols = [header.index(c) if c in header else None for c in ("location_id", "name", "osm_type", "osm_id")]
+        id_col, name_col, type_col, osm_col = cols
+        width = max(c for c in cols if c is not None) + 1
+        for row in reader:
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            # The first row wins for a duplicate location_id
+            index.setdefault(row[id_col], (
+                row[name_col] if name_col is not None else "",
+                row[type_col] if type_col is not None else "",
+                row[osm_col] if osm_col is not None else "",
+            ))
+    return index
+
+
+def location_index() -> dict[str, tuple[str, str, str]]:
+    """The cached locations.csv index, or {} if the file doesn't exist."""
+    try:
+        mtime = LOCATIONS_CSV.stat().st_mtime
+    except FileNotFoundError:
+        return {}
+    return load_location_index(LOCATIONS_CSV, mtime)
+
 
 def get_location_osm_info(location_id: str) -> dict | None:
     """Look up OSM info from locations.csv."""
-    csv_path = Path("data/locations.csv")
-
-    if not csv_path.exists():
+    found = location_index().get(location_id)
+    if found is None:
         return None
+    name, osm_type, osm_id = found
+    return {
+        "location_id": location_id,
+        "name": name,
+        "osm_type": osm_type,
+        "osm_id": osm_id,
+    }
 
-    with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get("location_id") == location_id:
-                return {
-                    "location_id": location_id,
-                    "name": row.get("name", ""),
-                    "osm_type": row.get("osm_type", ""),
-                    "osm_id": row.get("osm_id", ""),
-                }
-    return None
+
+def get_issue_details_rest(issue_number: int, repo: str, token: str) -> dict:
+    """Fetch issue details from the GitHub REST API (no gh process spawn)."""
+    req = urllib.request.Request(
+        f"https://api.github.com/repos/{repo}/issues/{issue_number}",
+        headers={
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {token}",
+            "User-Agent": "sats4duesseldorf-btcmap-link",
+        },
+    )
+    with urllib.request.urlopen(req, timeout=30) as resp:
+        data = json.loads(resp.read())
+    return {"body": data.get("body") or "", "title": data.get("title", "")}
 
 
 def get_issue_details(issue_number: int) -> dict | None:
-    """Fetch issue details from GitHub using gh CLI."""
+    """Fetch issue details from GitHub (REST API when a token is set, else gh CLI)."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    repo = os.environ.get("GITHUB_REPOSITORY")
+    if token and repo:
+        try:
+            return get_issue_details_rest(issue_number, repo, token)
+        except (OSError, ValueError):
+            # URLError, timeouts, bad JSON: fall back to the gh CLI below
+            pass
+
     try:
         result = subprocess.run(
             ["gh", "issue", "view", str(issue_number), "--json", "body,title"],
@@ -56,23 +138,47 @@ def get_issue_details(issue_number: int) -> dict | None:
         return None
 
 
-def extract_field(body: str, pattern: str) -> str:
-    """Extract a field from issue body using regex."""
-    match = re.search(pattern, body, re.IGNORECASE)
+def get_issues_details_graphql(issue_numbers: list[int]) -> dict[int, dict | None]:
+    """Fetch several issues of the current repo with a single `gh api graphql` call."""
+    fields = " ".join(f"i{n}: issue(number: {n}) {{ title body }}" for n in issue_numbers)
+    query = f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+    # gh exits non-zero if any issue is missing, but still prints the others
+    result = subprocess.run(
+        ["gh", "api", "graphql", "-F", "owner={owner}", "-F", "name={repo}", "-f", f"query={query}"],
+        capture_output=True,
+        text=True,
+    )
+    try:
+        repository = (json.loads(result.stdout).get("data") or {}).get("repository") or {}
+    except (json.JSONDecodeError, AttributeError):
+        repository = {}
+    return {n: repository.get(f"i{n}") for n in issue_numbers}
+
+
+def get_issues_details(issue_numbers: list[int]) -> dict[int, dict | None]:
+    """
+    Fetch several issues at once: issue_number -> details, or None if it could not be fetched.
+    Uses concurrent REST calls when a token is set, else one gh GraphQL query for all issues.
+    """
+    issue_numbers = list(dict.fromkeys(issue_numbers))
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if len(issue_numbers) == 1 or (token and os.environ.get("GITHUB_REPOSITORY")):
+        with ThreadPoolExecutor(max_workers=min(8, len(issue_numbers)) or 1) as pool:
+            return dict(zip(issue_numbers, pool.map(get_issue_details, issue_numbers)))
+    return get_issues_details_graphql(issue_numbers)
+
+
+def extract_field(body: str, pattern: re.Pattern) -> str:
+    """Extract a field from issue body using a compiled regex."""
+    match = pattern.search(body)
     return match.group(1).strip() if match else ""
 
 
 def extract_proof_urls(body: str) -> dict:
     """Extract proof URLs from issue body."""
     return {
-        "public_post": extract_field(body, r"\*\*1\. Öffentlicher Post[^*]*\*\*\s*`?([^\n`]+)") or
-                       extract_field(body, r"Öffentlicher Post[^\n]*\n+([^\n]+)"),
-        "receipt": extract_field(body, r"\*\*2\. Kaufbeleg[^*]*\*\*\s*`?([^\n`]+)") or
-                   extract_field(body, r"Kaufbeleg[^\n]*\n+([^\n]+)"),
-        "payment": extract_field(body, r"\*\*3\. Bitcoin-Zahlung[^*]*\*\*\s*`?([^\n`]+)") or
-                   extract_field(body, r"Bitcoin-Zahlung[^\n]*\n+([^\n]+)"),
-        "venue": extract_field(body, r"\*\*4\. Foto vom Ort[^*]*\*\*\s*`?([^\n`]+)") or
-                 extract_field(body, r"Foto vom Ort[^\n]*\n+([^\n]+)"),
+        field: extract_field(body, bold) or extract_field(body, plain)
+        for field, (bold, plain) in PROOF_PATTERNS.items()
     }
 
 
@@ -108,101 +214,143 @@ def generate_btcmap_notes(issue_url: str, proofs: dict) -> str:
     return "\n".join(lines)
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Generate BTCMap verification link for a location"
-    )
-    parser.add_argument("location_id", help="Location ID (e.g., DE-BE-00042)")
-    parser.add_argument("--issue", type=int, help="GitHub issue number for context")
-    parser.add_argument("--repo", default="satoshiinberlin/sats4berlin",
-                       help="GitHub repo (default: satoshiinberlin/sats4berlin)")
-    parser.add_argument("--json", action="store_true", help="Output as JSON")
-    parser.add_argument("--notes-only", action="store_true", help="Only output the BTCMap notes text")
-
-    args = parser.parse_args()
-
-    # Look up location
-    info = get_location_osm_info(args.location_id)
+def build_report(location_id: str, issue_number: int | None, issue_data: dict | None, repo: str) -> dict:
+    """
+    Collect the BTCMap/OSM links and proof notes for one location.
+    Raises LookupError (with the lines to print) if the location can't be verified.
+    """
+    info = get_location_osm_info(location_id)
 
     if not info:
-        print(f"Error: Location {args.location_id} not found in locations.csv")
-        sys.exit(1)
+        raise LookupError(f"Error: Location {location_id} not found in locations.csv")
 
     osm_type = info["osm_type"]
     osm_id = info["osm_id"]
 
     if not osm_type or not osm_id:
-        print(f"Error: Location {args.location_id} has no OSM data")
-        print("This location needs to be added to OpenStreetMap first.")
-        sys.exit(1)
-
-    btcmap_url = generate_btcmap_verify_url(osm_type, osm_id)
-    osm_url = generate_osm_url(osm_type, osm_id)
+        raise LookupError(
+            f"Error: Location {location_id} has no OSM data",
+            "This location needs to be added to OpenStreetMap first.",
+        )
 
     github_issue_url = ""
     proofs = {}
     btcmap_notes = ""
 
-    if args.issue:
-        github_issue_url = f"https://github.com/{args.repo}/issues/{args.issue}"
+    if issue_number:
+        github_issue_url = f"https://github.com/{repo}/issues/{issue_number}"
 
-        # Fetch issue details for proof URLs
-        issue_data = get_issue_details(args.issue)
+        # Proof URLs from the fetched issue details
         if issue_data and issue_data.get("body"):
             proofs = extract_proof_urls(issue_data["body"])
             btcmap_notes = generate_btcmap_notes(github_issue_url, proofs)
 
-    if args.notes_only:
-        if btcmap_notes:
-            print(btcmap_notes)
-        else:
-            print("Error: --notes-only requires --issue")
-            sys.exit(1)
-        return
-
-    if args.json:
-        print(json.dumps({
-            "location_id": args.location_id,
-            "name": info["name"],
-            "osm_type": osm_type,
-            "osm_id": osm_id,
-            "btcmap_verify_url": btcmap_url,
-            "osm_url": osm_url,
-            "github_issue_url": github_issue_url,
-            "proofs": proofs,
-            "btcmap_notes": btcmap_notes,
-        }, indent=2))
+    return {
+        "location_id": location_id,
+        "name": info["name"],
+        "osm_type": osm_type,
+        "osm_id": osm_id,
+        "btcmap_verify_url": generate_btcmap_verify_url(osm_type, osm_id),
+        "osm_url": generate_osm_url(osm_type, osm_id),
+        "github_issue_url": github_issue_url,
+        "proofs": proofs,
+        "btcmap_notes": btcmap_notes,
+    }
+
+
+def print_report(report: dict):
+    """Print the human-readable verification block for one location."""
+    print(f"\n{'='*60}")
+    print(f"  BTCMap Verification for {report['location_id']}")
+    print(f"{'='*60}\n")
+    print(f"Location:    {report['name']}")
+    print(f"OSM:         {report['osm_type']}/{report['osm_id']}")
+    print(f"")
+    print(f"BTCMap Verify URL:")
+    print(f"  {report['btcmap_verify_url']}")
+    print(f"")
+    print(f"OSM URL:")
+    print(f"  {report['osm_url']}")
+
+    if report["github_issue_url"]:
+        print(f"\nGitHub Issue:")
+        print(f"  {report['github_issue_url']}")
+
+    if report["btcmap_notes"]:
+        print(f"\n{'='*60}")
+        print("Copy-paste this into BTCMap 'Additional notes':")
+        print(f"{'='*60}")
+        print(report["btcmap_notes"])
+        print(f"{'='*60}")
     else:
         print(f"\n{'='*60}")
-        print(f"  BTCMap Verification for {args.location_id}")
-        print(f"{'='*60}\n")
-        print(f"Location:    {info['name']}")
-        print(f"OSM:         {osm_type}/{osm_id}")
-        print(f"")
-        print(f"BTCMap Verify URL:")
-        print(f"  {btcmap_url}")
-        print(f"")
-        print(f"OSM URL:")
-        print(f"  {osm_url}")
-
-        if github_issue_url:
-            print(f"\nGitHub Issue:")
-            print(f"  {github_issue_url}")
-
-        if btcmap_notes:
-            print(f"\n{'='*60}")
-            print("Copy-paste this into BTCMap 'Additional notes':")
-            print(f"{'='*60}")
-            print(btcmap_notes)
-            print(f"{'='*60}")
+        print("Instructions:")
+        print("1. Open the BTCMap Verify URL above")
+        print("2. Fill in the verification form")
+        print("3. Submit")
+        print(f"{'='*60}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate BTCMap verification link for a location"
+    )
+    parser.add_argument("location_id", nargs="*", help="Location ID(s) (e.g., DE-BE-00042)")
+    parser.add_argument("--location-ids-file", type=Path,
+                       help="Also read location IDs from this file (one per line)")
+    parser.add_argument("--all", action="store_true",
+                       help="All locations in locations.csv that have OSM data")
+    parser.add_argument("--issue", type=int, action="append",
+                       help="GitHub issue number for context (repeat once per location ID)")
+    parser.add_argument("--repo", default="satoshiinberlin/sats4berlin",
+                       help="GitHub repo (default: satoshiinberlin/sats4berlin)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--notes-only", action="store_true", help="Only output the BTCMap notes text")
+
+    args = parser.parse_args()
+
+    location_ids = list(args.location_id)
+    if args.location_ids_file:
+        location_ids += args.location_ids_file.read_text(encoding="utf-8").split()
+    if args.all:
+        location_ids += [lid for lid, (_, osm_type, osm_id) in location_index().items() if osm_type and osm_id]
+    if not location_ids:
+        parser.error("give at least one location ID, --location-ids-file or --all")
+    issue_numbers = args.issue or []
+    if issue_numbers and len(issue_numbers) != len(location_ids):
+        parser.error("pass one --issue per location ID")
+
+    # Fetch all issues up front, in one batch
+    issues = get_issues_details(issue_numbers) if issue_numbers else {}
+
+    reports = []
+    failed = False
+    for location_id, issue_number in zip(location_ids, issue_numbers or [None] * len(location_ids)):
+        try:
+            report = build_report(location_id, issue_number, issues.get(issue_number), args.repo)
+        except LookupError as e:
+            print("\n".join(e.args))
+            failed = True
+            continue
+
+        if args.notes_only:
+            if report["btcmap_notes"]:
+                print(report["btcmap_notes"])
+            else:
+                print("Error: --notes-only requires --issue")
+                failed = True
+        elif args.json:
+            reports.append(report)
         else:
-            print(f"\n{'='*60}")
-            print("Instructions:")
-            print("1. Open the BTCMap Verify URL above")
-            print("2. Fill in the verification form")
-            print("3. Submit")
-            print(f"{'='*60}")
-        print()
+            print_report(report)
+
+    if args.json and reports:
+        # A single location keeps the plain object output
+        print(json.dumps(reports[0] if len(location_ids) == 1 else reports, indent=2))
+
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
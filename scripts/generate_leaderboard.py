@@ -9,8 +9,9 @@ import csv
 import json
 import hashlib
 from pathlib import Path
-from datetime import datetime
-from collections import defaultdict
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 
 # Same pseudonym generation as anonymize_csv.py
 ADJECTIVES = [
@@ -25,11 +26,13 @@ FIGURES = [
 ]
 
 
+@lru_cache(maxsize=None)
 def generate_pseudonym(submitter_id: str) -> str:
     """Generate a deterministic pseudonym from a submitter_id."""
     if not submitter_id or submitter_id == "unknown":
         return "Anonymous"
 
+    # SHA-256 to match anonymize_csv.py and worker/src/index.js
     hash_bytes = hashlib.sha256(submitter_id.encode()).digest()
     adj_index = hash_bytes[0] % len(ADJECTIVES)
     fig_index = hash_bytes[1] % len(FIGURES)
@@ -46,58 +49,60 @@ def generate_leaderboard():
         print("No checks_public.csv found")
         return
 
-    # Read checks
-    with checks_path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-
-    # Aggregate by submitter
-    participants = defaultdict(lambda: {
-        "checks_count": 0,
-        "total_sats": 0,
-        "last_check_at": ""
-    })
-
-    for row in rows:
-        # Only count approved AND paid checks
-        if row.get("review_status") != "approved":
-            continue
-        if row.get("paid_status") != "paid":
-            continue
-
-        submitter_id = row.get("submitter_id", "").strip()
-        if not submitter_id:
-            continue
-
-        pseudonym = generate_pseudonym(submitter_id)
+    # Aggregate by submitter: pseudonym -> [checks_count, total_sats, last_check_at],
+    # streaming the checks in a single pass
+    participants = {}
+    total_checks_paid = 0
+    total_sats_paid = 0
 
-        # Parse bounty
-        try:
-            sats = int(row.get("final_bounty_sats", 0) or 0)
-        except ValueError:
-            sats = 0
-
-        # Get paid date
-        paid_at = row.get("paid_at", "")
-
-        participants[pseudonym]["checks_count"] += 1
-        participants[pseudonym]["total_sats"] += sats
-
-        # Track most recent check
-        if paid_at > participants[pseudonym]["last_check_at"]:
-            participants[pseudonym]["last_check_at"] = paid_at
+    with checks_path.open(newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            # Only count approved AND paid checks
+            if row.get("review_status") != "approved":
+                continue
+            if row.get("paid_status") != "paid":
+                continue
+
+            submitter_id = row.get("submitter_id", "").strip()
+            if not submitter_id:
+                continue
+
+            pseudonym = generate_pseudonym(submitter_id)
+
+            # Parse bounty
+            try:
+                sats = int(row.get("final_bounty_sats", 0) or 0)
+            except ValueError:
+                sats = 0
+
+            # Get paid date
+            paid_at = row.get("paid_at", "")
+
+            stats = participants.get(pseudonym)
+            if stats is None:
+                stats = participants[pseudonym] = [0, 0, ""]
+            stats[0] += 1
+            stats[1] += sats
+            total_checks_paid += 1
+            total_sats_paid += sats
+
+            # Track most recent check
+            if paid_at > stats[2]:
+                stats[2] = paid_at
 
     # Build sorted leaderboard (by sats desc, then by checks desc)
-    leaderboard = []
-    for pseudonym, stats in participants.items():
-        leaderboard.append({
+    leaderboard = [
+        {
             "pseudonym": pseudonym,
-            "checks_count": stats["checks_count"],
-            "total_sats": stats["total_sats"],
-            "last_check_at": stats["last_check_at"]
-        })
+            "checks_count": checks_count,
+            "total_sats": total_sats,
+            "last_check_at": last_check_at
+        }
+        for pseudonym, (checks_count, total_sats, last_check_at) in participants.items()
+    ]
 
-    leaderboard.sort(key=lambda x: (-x["total_sats"], -x["checks_count"]))
+    # Highest sats first, then most checks; ties keep insertion order
+    leaderboard.sort(key=itemgetter("total_sats", "checks_count"), reverse=True)
 
     # Add ranks
     for i, entry in enumerate(leaderboard, 1):
@@ -105,16 +110,15 @@ def generate_leaderboard():
 
     # Build output
     output = {
-        "last_updated": datetime.utcnow().isoformat() + "Z",
+        "last_updated": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         "total_participants": len(leaderboard),
-        "total_checks_paid": sum(p["checks_count"] for p in leaderboard),
-        "total_sats_paid": sum(p["total_sats"] for p in leaderboard),
+        "total_checks_paid": total_checks_paid,
+        "total_sats_paid": total_sats_paid,
         "leaderboard": leaderboard
     }
 
-    # Write leaderboard
-    with leaderboard_path.open("w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2)
+    # Write leaderboard (serialized to one string, written in one call)
+    leaderboard_path.write_text(json.dumps(output, indent=2), encoding="utf-8")
 
     print(f"Leaderboard generated: {len(leaderboard)} participants, {output['total_sats_paid']} sats paid")
 
@@ -11,12 +11,26 @@ This script MERGES data instead of overwriting:
 """
 import csv
 import datetime
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
 RAW = Path("data/duesseldorf_raw.csv")
 OUT = Path("data/locations.csv")
 
-TODAY = datetime.date.today().isoformat()
+TODAY_DATE = datetime.date.today()
+TODAY = TODAY_DATE.isoformat()
+
+# Düsseldorf bounds (approx.) used to flag suspicious coordinates
+DUS_MIN_LAT, DUS_MAX_LAT = 51.1, 51.4
+DUS_MIN_LON, DUS_MAX_LON = 6.6, 7.0
+
+# Bounty tiers by days since the last check: whole-day equivalents of
+# 6/12/24 months of 30.44 days. Below 3 months the location is in cooldown
+# and shows the minimum too
+BOUNTY_AGE_DAYS = (183, 366, 731)
+BOUNTY_BY_AGE = (10000, 13000, 17000, 21000)
 
 # Output schema
 OUT_FIELDS = [
@@ -52,12 +66,45 @@ BTCMAP_FIELDS = {
     "source_last_update", "source_last_update_tag",
 }
 
+# Plain text fields refreshed by update_location_from_btcmap:
+# (field, raw keys in priority order, default when all are empty)
+BTCMAP_TEXT_FIELDS = (
+    ("name", ("name",), ""),
+    ("street", ("street", "addr:street"), ""),
+    ("housenumber", ("housenumber", "addr:housenumber"), ""),
+    ("postcode", ("postcode", "addr:postcode"), ""),
+    ("city", ("city", "addr:city"), "Düsseldorf"),
+    ("website", ("website", "contact:website"), ""),
+    ("opening_hours", ("opening_hours",), ""),
+)
+
+# Fixed starting values of a location newly added from BTCMap; the
+# BTCMap-sourced fields are filled in per row
+NEW_LOCATION_DEFAULTS = {
+    "last_verified_at": "",
+    "verified_by_count": "0",
+    "verification_confidence": "low",
+    "bounty_critical_sats": "21000",
+    "bounty_new_entry_sats": "21000",
+    "new_location_status": "",  # Empty for BTCMap locations (already verified externally)
+    "location_status": "active",
+    "eligible_now": "yes",
+    "last_check_id": "",
+    "last_updated_at": TODAY,
+    "cooldown_until": "",
+    "cooldown_days_left": "0",
+    "eligible_for_check": "yes",
+}
+
 
 def get(row, *keys, default=""):
     """Get first non-empty value from row for given keys."""
+    # One lookup per key; CSV cells are str (or None for short rows), so
+    # truthiness is the same test as "not in (None, '')"
     for k in keys:
-        if k in row and row[k] not in (None, ""):
-            return row[k]
+        value = row.get(k)
+        if value:
+            return value
     return default
 
 
@@ -71,7 +118,7 @@ def validate_coordinates(lat_str, lon_str):
     """
     Validate and return coordinates.
     Returns (lat, lon) as strings if valid, ("", "") if invalid.
-    Düsseldorf bounds (approx.): lat ~51.1-51.4, lon ~6.6-7.0
+    Düsseldorf bounds (approx.): see DUS_MIN_LAT/DUS_MAX_LAT/DUS_MIN_LON/DUS_MAX_LON
     """
     try:
         if not lat_str or not lon_str:
@@ -83,7 +130,7 @@ def validate_coordinates(lat_str, lon_str):
             print(f"Warning: Coordinates out of global bounds: {lat}, {lon}")
             return "", ""
         # Düsseldorf-specific bounds check (warn but still accept)
-        if not (51.1 <= lat <= 51.4 and 6.6 <= lon <= 7.0):
+        if not (DUS_MIN_LAT <= lat <= DUS_MAX_LAT and DUS_MIN_LON <= lon <= DUS_MAX_LON):
             print(f"Warning: Coordinates outside Düsseldorf area: {lat}, {lon}")
         return str(lat), str(lon)
     except (ValueError, TypeError):
@@ -100,6 +147,8 @@ def normalize_url(row, osm_type, osm_id):
     return ""
 
 
+# BTCMap rows share a handful of check/survey dates, so parses are memoized
+@lru_cache(maxsize=4096)
 def parse_date(value: str):
     """Parse date string, return (date_str, is_valid)."""
     if not value:
@@ -114,8 +163,15 @@ def parse_date(value: str):
 
 def get_source_last_update(row):
     """Get the most recent check/survey date and which tag it came from."""
-    check_date, check_valid = parse_date(get(row, "check_date", default=""))
-    survey_date, survey_valid = parse_date(get(row, "survey:date", default=""))
+    return pick_source_last_update(get(row, "check_date", default=""), get(row, "survey:date", default=""))
+
+
+# Rows repeat the same (check_date, survey:date) pairs, so the pick is memoized
+@lru_cache(maxsize=4096)
+def pick_source_last_update(check_value: str, survey_value: str):
+    """Pick the newer of the check/survey dates: (date_str, tag) or ("", "")."""
+    check_date, check_valid = parse_date(check_value)
+    survey_date, survey_valid = parse_date(survey_value)
 
     if check_valid and survey_valid:
         if check_date >= survey_date:
@@ -130,6 +186,7 @@ def get_source_last_update(row):
         return "", ""
 
 
+@lru_cache(maxsize=None)
 def calculate_bounty(source_date: str) -> int:
     """
     Calculate bounty based on age since last check according to RULES.md:
@@ -146,24 +203,14 @@ def calculate_bounty(source_date: str) -> int:
     except ValueError:
         return 21000
 
-    today = datetime.date.today()
-    days_since = (today - last_check).days
-    months_since = days_since / 30.44
-
-    if months_since < 3:
-        return 10000  # In cooldown, show minimum
-    elif months_since < 6:
-        return 10000
-    elif months_since < 12:
-        return 13000
-    elif months_since < 24:
-        return 17000
-    else:
-        return 21000
+    return BOUNTY_BY_AGE[bisect_right(BOUNTY_AGE_DAYS, (TODAY_DATE - last_check).days)]
 
 
 def make_osm_key(osm_type, osm_id):
     """Create a unique key from OSM type and ID."""
+    # Rows without OSM data (None/"" cells) need no string work at all
+    if not osm_type or not osm_id:
+        return None
     t = str(osm_type).strip().lower()
     i = str(osm_id).strip()
     if t and i:
@@ -171,20 +218,6 @@ def make_osm_key(osm_type, osm_id):
     return None
 
 
-def get_max_location_id(rows):
-    """Get the highest location ID number from existing rows."""
-    max_num = 0
-    for row in rows:
-        lid = row.get("location_id", "")
-        if lid.startswith("DE-BE-"):
-            try:
-                num = int(lid.replace("DE-BE-", ""))
-                max_num = max(max_num, num)
-            except ValueError:
-                pass
-    return max_num
-
-
 def create_new_location_from_btcmap(raw_row, location_id):
     """Create a new location entry from BTCMap data."""
     osm_type = get(raw_row, "osm_type", "type", default="").strip()
@@ -197,37 +230,24 @@ def create_new_location_from_btcmap(raw_row, location_id):
     lon_raw = str(get(raw_row, "lon", "longitude", default="")).strip()
     lat, lon = validate_coordinates(lat_raw, lon_raw)
 
-    return {
+    row = NEW_LOCATION_DEFAULTS.copy()
+    row.update({
         "location_id": location_id,
         "osm_type": osm_type,
         "osm_id": osm_id,
         "btcmap_url": normalize_url(raw_row, osm_type, osm_id),
-        "name": get(raw_row, "name", default="").strip(),
         "category": normalize_category(raw_row),
-        "street": get(raw_row, "street", "addr:street", default="").strip(),
-        "housenumber": get(raw_row, "housenumber", "addr:housenumber", default="").strip(),
-        "postcode": get(raw_row, "postcode", "addr:postcode", default="").strip(),
-        "city": get(raw_row, "city", "addr:city", default="Düsseldorf").strip() or "Düsseldorf",
         "lat": lat,
         "lon": lon,
-        "website": get(raw_row, "website", "contact:website", default="").strip(),
-        "opening_hours": get(raw_row, "opening_hours", default="").strip(),
-        "last_verified_at": "",
-        "verified_by_count": "0",
-        "verification_confidence": "low",
         "bounty_base_sats": str(bounty),
-        "bounty_critical_sats": "21000",
-        "bounty_new_entry_sats": "21000",
-        "new_location_status": "",  # Empty for BTCMap locations (already verified externally)
-        "eligible_now": "yes",
-        "last_check_id": "",
-        "last_updated_at": TODAY,
         "source_last_update": source_date,
         "source_last_update_tag": source_tag,
-        "cooldown_until": "",
-        "cooldown_days_left": "0",
-        "eligible_for_check": "yes",
-    }
+    })
+    row.update(
+        (key, get(raw_row, *keys, default=default).strip() or default)
+        for key, keys, default in BTCMAP_TEXT_FIELDS
+    )
+    return row
 
 
 def update_location_from_btcmap(existing_row, raw_row):
@@ -246,30 +266,28 @@ def update_location_from_btcmap(existing_row, raw_row):
     lon_raw = str(get(raw_row, "lon", "longitude", default="")).strip()
     lat, lon = validate_coordinates(lat_raw, lon_raw)
 
-    # Build updated values for BTCMap fields
-    updates = {
-        "osm_type": osm_type,
-        "osm_id": osm_id,
-        "btcmap_url": normalize_url(raw_row, osm_type, osm_id),
-        "name": get(raw_row, "name", default="").strip(),
-        "category": normalize_category(raw_row),
-        "street": get(raw_row, "street", "addr:street", default="").strip(),
-        "housenumber": get(raw_row, "housenumber", "addr:housenumber", default="").strip(),
-        "postcode": get(raw_row, "postcode", "addr:postcode", default="").strip(),
-        "city": get(raw_row, "city", "addr:city", default="Düsseldorf").strip() or "Düsseldorf",
-        "lat": lat,
-        "lon": lon,
-        "website": get(raw_row, "website", "contact:website", default="").strip(),
-        "opening_hours": get(raw_row, "opening_hours", default="").strip(),
-        "source_last_update": source_date,
-        "source_last_update_tag": source_tag,
-        "bounty_base_sats": str(bounty),
-    }
+    # Updated values for BTCMap fields; the text fields are only read from
+    # the BTCMap row while comparing
+    computed = (
+        ("osm_type", osm_type),
+        ("osm_id", osm_id),
+        ("btcmap_url", normalize_url(raw_row, osm_type, osm_id)),
+        ("category", normalize_category(raw_row)),
+        ("lat", lat),
+        ("lon", lon),
+        ("source_last_update", source_date),
+        ("source_last_update_tag", source_tag),
+        ("bounty_base_sats", str(bounty)),
+    )
+    text_values = (
+        (key, get(raw_row, *keys, default=default).strip() or default)
+        for key, keys, default in BTCMAP_TEXT_FIELDS
+    )
 
     changed = False
-    for key, new_value in updates.items():
+    for key, new_value in chain(computed, text_values):
         old_value = existing_row.get(key, "")
-        if str(old_value).strip() != str(new_value).strip():
+        if str(old_value).strip() != new_value:
             existing_row[key] = new_value
             changed = True
 
@@ -293,9 +311,13 @@ def main():
     else:
         print(f"No existing {OUT}, starting fresh")
 
-    # Index existing locations by OSM key for fast lookup
+    # Index existing locations by OSM key for fast lookup. The same pass
+    # tracks the highest location ID number and the OSM keys of rows with a
+    # manual status, for the preserved-manual count below
     existing_by_osm = {}
     existing_by_id = {}
+    max_id_num = 0
+    manual_osm_keys = []
     for row in existing_rows:
         osm_key = make_osm_key(row.get("osm_type"), row.get("osm_id"))
         if osm_key:
@@ -303,12 +325,13 @@ def main():
         lid = row.get("location_id", "")
         if lid:
             existing_by_id[lid] = row
-
-    # Load BTCMap raw data
-    with RAW.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        raw_rows = list(reader)
-    print(f"Loaded {len(raw_rows)} locations from BTCMap ({RAW})")
+            if lid.startswith("DE-BE-"):
+                try:
+                    max_id_num = max(max_id_num, int(lid.replace("DE-BE-", "")))
+                except ValueError:
+                    pass
+        if row.get("new_location_status"):  # Has manual status = manually added
+            manual_osm_keys.append(osm_key)
 
     # Track statistics
     stats = {
@@ -321,46 +344,62 @@ def main():
     # Track which OSM keys we've seen from BTCMap
     btcmap_osm_keys = set()
 
-    # Get next available location ID
-    next_id_num = get_max_location_id(existing_rows) + 1
-
-    # Process BTCMap data
-    for raw_row in raw_rows:
-        osm_type = get(raw_row, "osm_type", "type", default="").strip()
-        osm_id = str(get(raw_row, "osm_id", "id", default="")).strip()
-        osm_key = make_osm_key(osm_type, osm_id)
+    # New rows must cover the output schema exactly (checked once, not per row)
+    if set(create_new_location_from_btcmap({}, "")) != set(OUT_FIELDS):
+        raise SystemExit("New location template does not match OUT_FIELDS")
 
-        if not osm_key:
-            continue  # Skip entries without valid OSM ID
-
-        btcmap_osm_keys.add(osm_key)
+    # Get next available location ID
+    next_id_num = max_id_num + 1
 
-        if osm_key in existing_by_osm:
-            # Update existing location
-            existing_row = existing_by_osm[osm_key]
-            if update_location_from_btcmap(existing_row, raw_row):
-                stats["updated"] += 1
+    # Process BTCMap data, streaming the raw rows in a single pass. The OSM
+    # key columns are resolved to indices once, so rows are read as plain
+    # lists and only turned into dicts once they have a valid OSM key
+    raw_count = 0
+    with RAW.open(newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        raw_fields = next(reader, [])
+        osm_type_cols = [raw_fields.index(k) for k in ("osm_type", "type") if k in raw_fields]
+        osm_id_cols = [raw_fields.index(k) for k in ("osm_id", "id") if k in raw_fields]
+        for values in reader:
+            if not values:
+                continue  # Blank line (DictReader skips these too)
+            raw_count += 1
+            n = len(values)
+            osm_type = next((values[i] for i in osm_type_cols if i < n and values[i]), "").strip()
+            osm_id = next((values[i] for i in osm_id_cols if i < n and values[i]), "").strip()
+            osm_key = make_osm_key(osm_type, osm_id)
+
+            if not osm_key:
+                continue  # Skip entries without valid OSM ID
+
+            raw_row = dict(zip(raw_fields, values))
+            btcmap_osm_keys.add(osm_key)
+
+            if osm_key in existing_by_osm:
+                # Update existing location
+                existing_row = existing_by_osm[osm_key]
+                if update_location_from_btcmap(existing_row, raw_row):
+                    stats["updated"] += 1
+                else:
+                    stats["unchanged"] += 1
             else:
-                stats["unchanged"] += 1
-        else:
-            # Add new location from BTCMap
-            new_location_id = f"DE-BE-{next_id_num:05d}"
-            next_id_num += 1
+                # Add new location from BTCMap
+                new_location_id = f"DE-BE-{next_id_num:05d}"
+                next_id_num += 1
 
-            new_row = create_new_location_from_btcmap(raw_row, new_location_id)
-            existing_rows.append(new_row)
-            existing_by_osm[osm_key] = new_row
-            existing_by_id[new_location_id] = new_row
-            stats["added"] += 1
+                new_row = create_new_location_from_btcmap(raw_row, new_location_id)
+                existing_rows.append(new_row)
+                existing_by_osm[osm_key] = new_row
+                existing_by_id[new_location_id] = new_row
+                stats["added"] += 1
 
-    # Count manually added locations (those without OSM key or not in BTCMap)
-    for row in existing_rows:
-        osm_key = make_osm_key(row.get("osm_type"), row.get("osm_id"))
-        if not osm_key or osm_key not in btcmap_osm_keys:
-            # This is a manually added location or removed from BTCMap
-            # We preserve it (don't delete)
-            if row.get("new_location_status"):  # Has manual status = manually added
-                stats["preserved_manual"] += 1
+    print(f"Loaded {raw_count} locations from BTCMap ({RAW})")
+
+    # Count manually added locations (those without OSM key or not in BTCMap);
+    # we preserve them (don't delete). Rows added above have no manual status
+    stats["preserved_manual"] = sum(
+        1 for osm_key in manual_osm_keys if not osm_key or osm_key not in btcmap_osm_keys
+    )
 
     # Sort by location_id for consistent output
     def sort_key(r):
@@ -374,21 +413,12 @@ def main():
 
     existing_rows.sort(key=sort_key)
 
-    # Ensure all rows have all fields
-    for row in existing_rows:
-        for field in OUT_FIELDS:
-            if field not in row:
-                row[field] = ""
-
-    # Write output
+    # Write output: only fields in OUT_FIELDS, in that order, "" for missing ones
     OUT.parent.mkdir(parents=True, exist_ok=True)
     with OUT.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=OUT_FIELDS)
-        w.writeheader()
-        for row in existing_rows:
-            # Only write fields in OUT_FIELDS
-            filtered_row = {k: row.get(k, "") for k in OUT_FIELDS}
-            w.writerow(filtered_row)
+        w = csv.writer(f)
+        w.writerow(OUT_FIELDS)
+        w.writerows([row.get(k, "") for k in OUT_FIELDS] for row in existing_rows)
 
     print(f"Wrote {OUT} with {len(existing_rows)} rows.")
     print(f"  Updated from BTCMap: {stats['updated']}")